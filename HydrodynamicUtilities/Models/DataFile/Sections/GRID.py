@@ -11,6 +11,7 @@ import numpy as np
 
 from ..Base import Section, UnInitializedSection, Keyword, UnknownKeyword
 from ..ASCIIFile import ASCIIText
+from ...EclipseBinaryFile.ActiveIndex import ActiveIndex
 
 
 class CubeProperty(Keyword):
@@ -442,11 +443,14 @@ class GRID(Section):
     def get_cubs_keyword(cls) -> Tuple[str, ...]:
         return cls.__Cubs
 
+    def __get_dimens(self) -> Optional[DIMENS]:
+        runspec = getattr(self.get_data_file(), "RUNSPEC", None)
+        dimens: Optional[DIMENS] = getattr(runspec, "DIMENS", None)
+        return dimens
+
     def __for_index(self) -> Optional[Tuple[DIMENS, CubeProperty]]:
-        datafile = self.get_data_file()
-        try:
-            dimens = datafile.RUNSPEC.DIMENS
-        except AttributeError:
+        dimens = self.__get_dimens()
+        if dimens is None:
             return None
 
         try:
@@ -456,63 +460,67 @@ class GRID(Section):
             return None
         return dimens, kw
 
-    def get_k_index(self) -> Optional[CubeProperty]:
+    def __get_active_index(self) -> Optional[Tuple[ActiveIndex, int]]:
         dc = self.__for_index()
         if dc is None:
             return None
 
         dimens, kw = dc[0], dc[1]
+        active_index = ActiveIndex.get(dimens.NX, dimens.NY, dimens.NZ)
+        return active_index, len(kw.Data)
 
-        index = np.arange(len(kw.Data))
-        k_index = index // (dimens.NX * dimens.NY) + 1
+    def get_k_index(self) -> Optional[CubeProperty]:
+        ai = self.__get_active_index()
+        if ai is None:
+            return None
+
+        active_index, length = ai[0], ai[1]
+        k_index = active_index.global_ijk()[2][:length].copy()
         return CubeProperty(k_index, section=self)
 
     def get_j_index(self) -> Optional[CubeProperty]:
-        dc = self.__for_index()
-        if dc is None:
+        ai = self.__get_active_index()
+        if ai is None:
             return None
 
-        dimens, kw = dc[0], dc[1]
-
-        index = np.arange(len(kw.Data))
-        k_index = index // (dimens.NX * dimens.NY) + 1
-        layer_index = (k_index - 1) * dimens.NX * dimens.NY
-        j_index = layer_index // dimens.NX
+        active_index, length = ai[0], ai[1]
+        j_index = active_index.global_ijk()[1][:length].copy()
         return CubeProperty(j_index, section=self)
 
     def get_i_index(self) -> Optional[CubeProperty]:
-        dc = self.__for_index()
-        if dc is None:
+        ai = self.__get_active_index()
+        if ai is None:
             return None
 
-        dimens, kw = dc[0], dc[1]
-
-        index = np.arange(len(kw.Data))
-        k_index = index // (dimens.NX * dimens.NY) + 1
-        layer_index = (k_index - 1) * dimens.NX * dimens.NY
-        i_index = layer_index % dimens.NX
+        active_index, length = ai[0], ai[1]
+        i_index = active_index.global_ijk()[0][:length].copy()
         return CubeProperty(i_index, section=self)
 
     def get_i_j_k_index(
         self,
     ) -> Optional[Tuple[CubeProperty, CubeProperty, CubeProperty]]:
-        dc = self.__for_index()
-        if dc is None:
+        ai = self.__get_active_index()
+        if ai is None:
             return None
 
-        dimens, kw = dc[0], dc[1]
-
-        index = np.arange(len(kw.Data))
-        k_index = index // (dimens.NX * dimens.NY) + 1
-        layer_index = (k_index - 1) * dimens.NX * dimens.NY
-        j_index = layer_index // dimens.NX
-        i_index = layer_index % dimens.NX
+        active_index, length = ai[0], ai[1]
+        i_index, j_index, k_index = active_index.global_ijk()
 
-        i = CubeProperty(i_index, section=self)
-        j = CubeProperty(j_index, section=self)
-        k = CubeProperty(k_index, section=self)
+        i = CubeProperty(i_index[:length].copy(), section=self)
+        j = CubeProperty(j_index[:length].copy(), section=self)
+        k = CubeProperty(k_index[:length].copy(), section=self)
         return i, j, k
 
+    def get_active_index(self) -> Optional[ActiveIndex]:
+        dimens = self.__get_dimens()
+        if dimens is None:
+            return None
+
+        actnum: Optional[CubeProperty] = getattr(self.Cubs, "ACTNUM", None)
+        if actnum is None:
+            return ActiveIndex.get(dimens.NX, dimens.NY, dimens.NZ)
+        return ActiveIndex.get(dimens.NX, dimens.NY, dimens.NZ, actnum.Data)
+
 
 class UnInitializedGRID(UnInitializedSection):
     @staticmethod
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple, Optional, Union
+
+import hashlib
+import numpy as np
+
+
+class ActiveIndex:
+    """
+    Mapping between global cell order (I fastest, then J, then K) and active
+    cell order of INIT/UNRST properties. IJK are 1-based as in Eclipse.
+    Instances are shared through 'get', so their arrays are read-only.
+    """
+
+    cache_size: int = 8
+    __cache: Dict[Tuple[int, int, int, str], ActiveIndex] = dict()
+
+    def __init__(
+        self,
+        nx: int,
+        ny: int,
+        nz: int,
+        actnum: Optional[np.ndarray] = None,
+    ) -> None:
+        self.NX = int(nx)
+        self.NY = int(ny)
+        self.NZ = int(nz)
+
+        if actnum is None:
+            active = np.ones(self.size, dtype=bool)
+        else:
+            active = np.ravel(actnum) > 0
+        if len(active) != self.size:
+            raise ValueError(f"ACTNUM has {len(active)} cells, expected {self.size}")
+
+        self.ActiveToGlobal = np.flatnonzero(active).astype(np.int32)
+        self.GlobalToActive = np.full(self.size, -1, dtype=np.int32)
+        self.GlobalToActive[self.ActiveToGlobal] = np.arange(
+            len(self.ActiveToGlobal), dtype=np.int32
+        )
+        self.ActiveToGlobal.flags.writeable = False
+        self.GlobalToActive.flags.writeable = False
+        self.__global_ijk: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__} {self.NX}x{self.NY}x{self.NZ} "
+            f"{self.number_active} active"
+        )
+
+    @classmethod
+    def get(
+        cls,
+        nx: int,
+        ny: int,
+        nz: int,
+        actnum: Optional[np.ndarray] = None,
+    ) -> ActiveIndex:
+        if actnum is None:
+            key = (int(nx), int(ny), int(nz), "")
+        else:
+            active = np.packbits(np.ravel(actnum) > 0).tobytes()
+            key = (int(nx), int(ny), int(nz), hashlib.sha1(active).hexdigest())
+
+        if key not in cls.__cache:
+            if len(cls.__cache) >= cls.cache_size:
+                cls.__cache.pop(next(iter(cls.__cache)))
+            cls.__cache[key] = cls(nx, ny, nz, actnum)
+        return cls.__cache[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.__cache.clear()
+
+    @property
+    def size(self) -> int:
+        return self.NX * self.NY * self.NZ
+
+    @property
+    def number_active(self) -> int:
+        return len(self.ActiveToGlobal)
+
+    @property
+    def active(self) -> np.ndarray:
+        return self.GlobalToActive >= 0
+
+    def global_ijk(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.__global_ijk is None:
+            index = np.arange(self.size, dtype=np.int32)
+            k, rest = np.divmod(index, self.NX * self.NY)
+            j, i = np.divmod(rest, self.NX)
+            ijk = (i + 1, j + 1, k + 1)
+            for values in ijk:
+                values.flags.writeable = False
+            self.__global_ijk = ijk
+        return self.__global_ijk
+
+    def active_ijk(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        i, j, k = self.global_ijk()
+        index = self.ActiveToGlobal
+        return i[index], j[index], k[index]
+
+    def global_index(
+        self,
+        i: Union[int, np.ndarray],
+        j: Union[int, np.ndarray],
+        k: Union[int, np.ndarray],
+    ) -> Union[int, np.ndarray]:
+        i, j, k = np.asarray(i) - 1, np.asarray(j) - 1, np.asarray(k) - 1
+        index: Union[int, np.ndarray] = (k * self.NY + j) * self.NX + i
+        return index
+
+    def active_index(
+        self,
+        i: Union[int, np.ndarray],
+        j: Union[int, np.ndarray],
+        k: Union[int, np.ndarray],
+    ) -> Union[int, np.ndarray]:
+        index: Union[int, np.ndarray] = self.GlobalToActive[self.global_index(i, j, k)]
+        return index
+
+    def to_global(self, values: np.ndarray, fill: float = np.nan) -> np.ndarray:
+        values = np.asarray(values)
+        dtype: np.dtype = values.dtype
+        if np.issubdtype(dtype, np.integer) and np.isnan(fill):
+            dtype = np.dtype(np.float64)
+        results = np.full((self.size,) + values.shape[1:], fill, dtype=dtype)
+        results[self.ActiveToGlobal] = values
+        return results
+
+    def to_active(self, values: np.ndarray) -> np.ndarray:
+        results: np.ndarray = np.asarray(values)[self.ActiveToGlobal]
+        return results
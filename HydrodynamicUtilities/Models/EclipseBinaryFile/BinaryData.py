@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, List, Callable, Optional
+    from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader.Index import (
+        KeywordIndex,
+    )
+
+import numpy as np
 
 
 class EclipseBinaryData:
@@ -8,12 +16,73 @@ class EclipseBinaryData:
 
 
 class BinaryData(EclipseBinaryData):
-    def __init__(self, data: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        data: Dict[str, Any],
+        index: Optional[KeywordIndex] = None,
+    ) -> None:
         for key in data.keys():
             self.__setattr__(key, data[key])
+        self._index = index
 
     def __getattr__(self, item: str) -> Any:
         return super().__getattribute__(item)
 
     def keys(self) -> List[str]:
-        return list(self.__dict__)
+        return [key for key in self.__dict__ if not key.startswith("_")]
+
+    @property
+    def index(self) -> KeywordIndex:
+        if self._index is None:
+            raise ValueError("Record index is not known")
+        return self._index
+
+    def count(self, keyword: str) -> int:
+        if keyword in self.index:
+            return len(self.index[keyword])
+        else:
+            return 0
+
+    def positions(self, keyword: str) -> np.ndarray:
+        return np.array([header.position for header in self.index[keyword]])
+
+    def get(self, keyword: str, occurrence: Optional[int] = None) -> Any:
+        value = getattr(self, keyword)
+        if occurrence is None:
+            return value
+
+        sizes = [header.number_obj for header in self.index[keyword]]
+        occurrence = range(len(sizes))[occurrence]
+        start = sum(sizes[:occurrence])
+        return np.ravel(value)[start : start + sizes[occurrence]]
+
+
+class LazyBinaryData(BinaryData):
+    def __init__(
+        self,
+        index: KeywordIndex,
+        loader: Callable[[str, Optional[int]], Any],
+    ) -> None:
+        super().__init__(dict(), index)
+        self._loader = loader
+
+    def __getattr__(self, item: str) -> Any:
+        index = self.__dict__.get("_index")
+        if index is None or item not in index:
+            raise AttributeError(item)
+        value = self._loader(item, None)
+        self.__setattr__(item, value)
+        return value
+
+    def keys(self) -> List[str]:
+        return self.index.keys()
+
+    def clear(self) -> None:
+        for key in [key for key in self.__dict__ if not key.startswith("_")]:
+            del self.__dict__[key]
+
+    def get(self, keyword: str, occurrence: Optional[int] = None) -> Any:
+        if occurrence is None:
+            return getattr(self, keyword)
+        else:
+            return self._loader(keyword, occurrence)
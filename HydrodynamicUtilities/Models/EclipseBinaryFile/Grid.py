@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple, Callable
+
+from .BinaryData import EclipseBinaryData, BinaryData
+from .ActiveIndex import ActiveIndex
+
+import numpy as np
+
+
+class GridGeometry:
+    """
+    Corner-point geometry of one grid (main or LGR). Corners are built one
+    layer at a time, cells are in global order: I fastest, then J, then K.
+    """
+
+    # Tetrahedra sharing the 0-7 diagonal, corner id = di + 2 * dj + 4 * dk
+    __tetrahedra = np.array([[1, 3], [3, 2], [2, 6], [6, 4], [4, 5], [5, 1]])
+
+    def __init__(
+        self,
+        name: str,
+        gridhead: np.ndarray,
+        coord: np.ndarray,
+        zcorn: np.ndarray,
+        actnum: Optional[np.ndarray] = None,
+        hostnum: Optional[np.ndarray] = None,
+    ) -> None:
+        self.Name = name
+        self.NX = int(gridhead[1])
+        self.NY = int(gridhead[2])
+        self.NZ = int(gridhead[3])
+        self.COORD = coord
+        self.ZCORN = zcorn
+        self.ACTNUM = actnum
+        self.HOSTNUM = hostnum
+        self.__pillars: Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {self.Name} {self.NX}x{self.NY}x{self.NZ}"
+
+    @property
+    def size(self) -> int:
+        return self.NX * self.NY * self.NZ
+
+    @property
+    def active(self) -> np.ndarray:
+        if self.ACTNUM is None:
+            return np.ones(self.size, dtype=bool)
+        return np.ravel(self.ACTNUM) > 0
+
+    @property
+    def active_index(self) -> ActiveIndex:
+        return ActiveIndex.get(self.NX, self.NY, self.NZ, self.ACTNUM)
+
+    def __get_pillars(self) -> np.ndarray:
+        if self.__pillars is None:
+            coord = np.ravel(self.COORD).astype(np.float64)
+            coord = coord.reshape(self.NY + 1, self.NX + 1, 6)
+            pillars = np.array(
+                [
+                    [coord[dj : dj + self.NY, di : di + self.NX] for di in (0, 1)]
+                    for dj in (0, 1)
+                ]
+            ).transpose(2, 3, 0, 1, 4)
+            self.__pillars = pillars.reshape(self.NY * self.NX, 1, 2, 2, 6)
+        return self.__pillars
+
+    def layer_corners(self, layer: int) -> np.ndarray:
+        length = 8 * self.NX * self.NY
+        zcorn = np.ravel(self.ZCORN)[layer * length : (layer + 1) * length]
+        z = zcorn.astype(np.float64).reshape(2, self.NY, 2, self.NX, 2)
+        z = z.transpose(1, 3, 0, 2, 4).reshape(self.NY * self.NX, 2, 2, 2)
+
+        pillars = self.__get_pillars()
+        top, bottom = pillars[..., :3], pillars[..., 3:]
+        height = bottom[..., 2] - top[..., 2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(height != 0, (z - top[..., 2]) / height, 0)
+        x = top[..., 0] + (bottom[..., 0] - top[..., 0]) * weight
+        y = top[..., 1] + (bottom[..., 1] - top[..., 1]) * weight
+
+        corners: np.ndarray = np.stack([x, y, z], axis=-1)
+        return corners.reshape(self.NY * self.NX, 8, 3)
+
+    def iter_layers(
+        self,
+        layers: Optional[Iterable[int]] = None,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        if layers is None:
+            layers = range(self.NZ)
+        for layer in layers:
+            yield layer, self.layer_corners(layer)
+
+    @staticmethod
+    def get_centroids(corners: np.ndarray) -> np.ndarray:
+        centroids: np.ndarray = corners.mean(axis=1)
+        return centroids
+
+    @classmethod
+    def get_volumes(cls, corners: np.ndarray) -> np.ndarray:
+        origin = corners[:, 0]
+        diagonal = corners[:, 7] - origin
+        first = corners[:, cls.__tetrahedra[:, 0]] - origin[:, np.newaxis]
+        second = corners[:, cls.__tetrahedra[:, 1]] - origin[:, np.newaxis]
+        product = np.cross(first, second)
+        volumes: np.ndarray = np.abs(np.einsum("ntk,nk->n", product, diagonal)) / 6
+        return volumes
+
+    @staticmethod
+    def get_bounding_boxes(corners: np.ndarray) -> np.ndarray:
+        boxes: np.ndarray = np.stack([corners.min(axis=1), corners.max(axis=1)], axis=1)
+        return boxes
+
+    def __compute(
+        self,
+        function: Callable[[np.ndarray], np.ndarray],
+        shape: Tuple[int, ...],
+        active_only: bool,
+    ) -> np.ndarray:
+        layer_size = self.NX * self.NY
+        active = self.active.reshape(self.NZ, layer_size)
+        if active_only:
+            results = np.empty((int(active.sum()),) + shape)
+        else:
+            results = np.empty((self.size,) + shape)
+
+        start = 0
+        for layer, corners in self.iter_layers():
+            if active_only:
+                corners = corners[active[layer]]
+            values = function(corners)
+            results[start : start + len(values)] = values
+            start += len(values)
+        return results
+
+    def centroids(self, active_only: bool = False) -> np.ndarray:
+        return self.__compute(self.get_centroids, (3,), active_only)
+
+    def volumes(self, active_only: bool = False) -> np.ndarray:
+        return self.__compute(self.get_volumes, (), active_only)
+
+    def bounding_boxes(self, active_only: bool = False) -> np.ndarray:
+        return self.__compute(self.get_bounding_boxes, (2, 3), active_only)
+
+
+class EGRID(EclipseBinaryData):
+    def __init__(self, data: BinaryData) -> None:
+        self.Data = data
+        self.__grids: Dict[str, GridGeometry] = dict()
+
+    def __getattr__(self, item: str) -> Any:
+        if item.startswith("_"):
+            raise AttributeError(item)
+        return getattr(self.Data, item)
+
+    def __segments(self) -> np.ndarray:
+        starts = self.Data.positions("GRIDHEAD")
+        ends = self.Data.positions("ENDGRID")
+        if len(ends) < len(starts):
+            ends = np.append(ends, np.iinfo(np.int64).max)
+        return np.stack([starts, ends[: len(starts)]], axis=1)
+
+    @property
+    def names(self) -> List[str]:
+        names = [""]
+        for occurrence in range(self.Data.count("LGR")):
+            names.append(str(self.Data.get("LGR", occurrence)[0]))
+        return names
+
+    def __occurrence(self, keyword: str, segment: np.ndarray) -> Optional[int]:
+        if self.Data.count(keyword) == 0:
+            return None
+        positions = self.Data.positions(keyword)
+        inside = np.flatnonzero((positions >= segment[0]) & (positions < segment[1]))
+        if len(inside) == 0:
+            return None
+        return int(inside[0])
+
+    def __load(self, keyword: str, segment: np.ndarray) -> Optional[np.ndarray]:
+        occurrence = self.__occurrence(keyword, segment)
+        if occurrence is None:
+            return None
+        values: np.ndarray = self.Data.get(keyword, occurrence)
+        return values
+
+    def __require(self, keyword: str, name: str, segment: np.ndarray) -> np.ndarray:
+        values = self.__load(keyword, segment)
+        if values is None:
+            raise KeyError(f"{keyword} is not found for grid {name!r} in EGRID")
+        return values
+
+    def grid(self, name: str = "") -> GridGeometry:
+        if name not in self.__grids:
+            names = self.names
+            if name not in names:
+                raise KeyError(f"Grid {name} is not found in EGRID")
+            segment = self.__segments()[names.index(name)]
+            self.__grids[name] = GridGeometry(
+                name,
+                self.__require("GRIDHEAD", name, segment),
+                self.__require("COORD", name, segment),
+                self.__require("ZCORN", name, segment),
+                self.__load("ACTNUM", segment),
+                self.__load("HOSTNUM", segment),
+            )
+        return self.__grids[name]
+
+    @property
+    def main(self) -> GridGeometry:
+        return self.grid("")
+
+    def lgrs(self) -> List[GridGeometry]:
+        return [self.grid(name) for name in self.names[1:]]
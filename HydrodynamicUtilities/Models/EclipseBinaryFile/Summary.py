@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+import fnmatch
 import numpy as np
 import pandas as pd
 
@@ -7,6 +9,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import List, Union, Dict, Any, Tuple, Optional, Iterable
+    from pathlib import Path
 
 from .BinaryData import EclipseBinaryData
 
@@ -20,6 +23,11 @@ import pandas as pd
 
 
 class SUMMARYHeader:
+    """
+    Keywords, Names and Num are read-only arrays, so the cached lookups
+    can not go stale; assign new arrays to change them.
+    """
+
     def __init__(
         self,
         keywords: np.ndarray,
@@ -27,18 +35,188 @@ class SUMMARYHeader:
         num: np.ndarray,
         unit: np.ndarray,
     ) -> None:
-        self.Keywords = keywords.astype(str)
-        self.Names = names.astype(str)
+        self.__lookup: Dict[str, Dict[Any, np.ndarray]] = dict()
+        self.__categories: Dict[str, Tuple[np.ndarray, np.ndarray]] = dict()
+        self.__selections: Dict[str, np.ndarray] = dict()
+        self.Keywords = keywords.astype(str, copy=False)
+        self.Names = names.astype(str, copy=False)
         try:
-            self.Num = num.astype(int)
+            self.Num = num.astype(int, copy=False)
         except ValueError:
             self.Num = num.astype(object)
-        self.Unit = unit.astype(str)
+        self.Unit = unit.astype(str, copy=False)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__} {len(self.Keywords)}"
 
-    def __index(
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "Keywords": self.Keywords,
+            "Names": self.Names,
+            "Num": self.Num,
+            "Unit": self.Unit,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__lookup = dict()
+        self.__categories = dict()
+        self.__selections = dict()
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    @staticmethod
+    def __read_only(values: np.ndarray) -> np.ndarray:
+        values = np.array(values, copy=True)
+        values.flags.writeable = False
+        return values
+
+    @staticmethod
+    def __freeze(values: np.ndarray) -> np.ndarray:
+        values.flags.writeable = False
+        return values
+
+    @property
+    def Keywords(self) -> np.ndarray:
+        return self.__keywords
+
+    @Keywords.setter
+    def Keywords(self, values: np.ndarray) -> None:
+        self.__keywords = self.__read_only(values)
+        self.reset_index()
+
+    @property
+    def Names(self) -> np.ndarray:
+        return self.__names
+
+    @Names.setter
+    def Names(self, values: np.ndarray) -> None:
+        self.__names = self.__read_only(values)
+        self.reset_index()
+
+    @property
+    def Num(self) -> np.ndarray:
+        return self.__num
+
+    @Num.setter
+    def Num(self, values: np.ndarray) -> None:
+        self.__num = self.__read_only(values)
+        self.reset_index()
+
+    @staticmethod
+    def __group(keys: List[Any]) -> Dict[Any, np.ndarray]:
+        groups: Dict[Any, List[int]] = dict()
+        for column, key in enumerate(keys):
+            groups.setdefault(key, []).append(column)
+        return {key: np.array(columns) for key, columns in groups.items()}
+
+    def __get_lookup(self) -> Dict[str, Dict[Any, np.ndarray]]:
+        if self.__lookup:
+            return self.__lookup
+
+        keywords = self.Keywords.astype(str).tolist()
+        names = self.Names.astype(str).tolist()
+        num = self.Num.astype(str).tolist()
+        self.__lookup = {
+            "keywords": self.group_columns("keywords"),
+            "names": self.group_columns("names"),
+            "num": self.group_columns("num"),
+            "keywords_names": self.__group(list(zip(keywords, names))),
+            "all": self.__group(list(zip(keywords, names, num))),
+        }
+        return self.__lookup
+
+    def __get_categories(self, param: str) -> Tuple[np.ndarray, np.ndarray]:
+        if param not in self.__categories:
+            if param == "keywords":
+                vector = self.Keywords
+            elif param == "names":
+                vector = self.Names
+            elif param == "num":
+                vector = self.Num
+            else:
+                raise KeyError
+            categories, codes = np.unique(vector.astype(str), return_inverse=True)
+            self.__categories[param] = (categories, codes)
+        return self.__categories[param]
+
+    def group_columns(self, param: str) -> Dict[str, np.ndarray]:
+        categories, codes = self.__get_categories(param)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        return dict(zip(categories.tolist(), np.split(order, bounds)))
+
+    def factorize(self, unit: bool = False) -> np.ndarray:
+        codes = np.zeros(len(self.Keywords), dtype=np.int64)
+        for param in ("keywords", "names", "num"):
+            categories, param_codes = self.__get_categories(param)
+            codes = codes * len(categories) + param_codes
+            codes = np.unique(codes, return_inverse=True)[1]
+        if unit:
+            categories, param_codes = np.unique(
+                self.Unit.astype(str), return_inverse=True
+            )
+            codes = codes * len(categories) + param_codes
+            codes = np.unique(codes, return_inverse=True)[1]
+        return codes
+
+    def reset_index(self) -> None:
+        self.__lookup = dict()
+        self.__categories = dict()
+        self.__selections = dict()
+
+    def __match(self, pattern: str, param: str) -> np.ndarray:
+        categories, codes = self.__get_categories(param)
+        if pattern == "*":
+            return np.ones(len(codes), dtype=bool)
+        regex = re.compile(fnmatch.translate(pattern))
+        matched = np.array([regex.match(c) is not None for c in categories.tolist()])
+        if len(matched) == 0:
+            return np.zeros(len(codes), dtype=bool)
+        mask: np.ndarray = matched[codes]
+        return mask
+
+    def select(self, *patterns: str) -> np.ndarray:
+        """
+        Column index of vectors matching any of 'KEYWORD[:NAME[:NUM]]'
+        patterns with Eclipse wildcards '*' and '?', e.g. 'WOPR:PROD*'.
+        """
+        results = []
+        for pattern in patterns:
+            if pattern not in self.__selections:
+                parts = str(pattern).split(":")
+                if len(parts) > 3:
+                    raise ValueError(f"Wrong summary pattern {pattern}")
+                mask = np.ones(len(self.Keywords), dtype=bool)
+                for part, param in zip(parts, ("keywords", "names", "num")):
+                    mask &= self.__match(part, param)
+                self.__selections[pattern] = np.flatnonzero(mask)
+            results.append(self.__selections[pattern])
+
+        if len(results) == 0:
+            return np.zeros(0, dtype=int)
+        elif len(results) == 1:
+            return results[0].copy()
+        index: np.ndarray = np.unique(np.concatenate(results))
+        return index
+
+    @staticmethod
+    def __is_single(values: Any) -> bool:
+        return isinstance(values, (str, np.str_, np.number, int, float))
+
+    def __lookup_columns(self, values: Any, param: str) -> np.ndarray:
+        lookup = self.__get_lookup()[param]
+        if self.__is_single(values):
+            values = [values]
+        found = [lookup.get(str(value)) for value in values]
+        columns: List[np.ndarray] = [c for c in found if c is not None]
+        if len(columns) == 0:
+            return np.zeros(0, dtype=int)
+        elif len(columns) == 1:
+            return columns[0]
+        index: np.ndarray = np.unique(np.concatenate(columns))
+        return index
+
+    def __mask(
         self,
         values: Union[List[str], str],
         param: str,
@@ -54,7 +232,7 @@ class SUMMARYHeader:
 
         pattern: Optional[np.ndarray] = None
 
-        if isinstance(values, (np.str, np.number, int, float)):
+        if self.__is_single(values):
             pattern = vector == str(values)
 
         else:
@@ -67,44 +245,75 @@ class SUMMARYHeader:
 
         return pattern
 
-    def index(
+    def mask(
         self,
         keywords: Union[List[str], str] = None,
         names: Union[List[str], str] = None,
         num: Union[List[str], str] = None,
     ) -> np.ndarray:
         if keywords is not None:
-            keywords_pattern = self.__index(keywords, "keywords")
+            keywords_pattern = self.__mask(keywords, "keywords")
         else:
             keywords_pattern = np.ones(self.Keywords.shape) == 1
 
         if names is not None:
-            names_pattern = self.__index(names, "names")
+            names_pattern = self.__mask(names, "names")
         else:
             names_pattern = np.ones(self.Names.shape) == 1
 
         if num is not None:
-            num_pattern = self.__index(num, "num")
+            num_pattern = self.__mask(num, "num")
         else:
             num_pattern = np.ones(self.Num.shape) == 1
 
-        if num_pattern is None:
-            return np.ndarray([])
-        elif names_pattern is None:
-            return np.ndarray([])
-        elif keywords_pattern is None:
-            return np.ndarray([])
+        if num_pattern is None or names_pattern is None or keywords_pattern is None:
+            return np.zeros(self.Keywords.shape, dtype=bool)
         else:
-            pattern = keywords_pattern & names_pattern & num_pattern
-            index: np.ndarray = np.arange(len(pattern))[pattern]
-            return index
+            return keywords_pattern & names_pattern & num_pattern
+
+    def index(
+        self,
+        keywords: Optional[Union[Iterable[str], str]] = None,
+        names: Optional[Union[Iterable[str], str]] = None,
+        num: Optional[Union[Iterable[str], str]] = None,
+    ) -> np.ndarray:
+        if keywords is None and names is None and num is None:
+            return np.arange(len(self.Keywords))
+
+        single = [v is None or self.__is_single(v) for v in (keywords, names, num)]
+        if all(single) and keywords is not None and names is not None:
+            lookup = self.__get_lookup()
+            key: Tuple[str, ...]
+            if num is None:
+                key = (str(keywords), str(names))
+                columns = lookup["keywords_names"].get(key)
+            else:
+                key = (str(keywords), str(names), str(num))
+                columns = lookup["all"].get(key)
+            if columns is None:
+                return np.zeros(0, dtype=int)
+            return columns.copy()
+
+        index = np.arange(len(self.Keywords))
+        for values, param in ((keywords, "keywords"), (names, "names"), (num, "num")):
+            if values is None:
+                continue
+            columns = self.__lookup_columns(values, param)
+            index = np.intersect1d(index, columns, assume_unique=True)
+        return index
 
     def new(self, index: np.ndarray) -> SUMMARYHeader:
-        new_keywords = self.Keywords[index]
-        new_names = self.Names[index]
-        new_num = self.Num[index]
-        new_units = np.array(self.Unit)[index]
-        return SUMMARYHeader(new_keywords, new_names, new_num, new_units)
+        """
+        Header of the columns 'index'. Indexing gives new arrays (or views of
+        these read-only ones), so they are taken over without another copy.
+        """
+        header = SUMMARYHeader.__new__(SUMMARYHeader)
+        header.reset_index()
+        header.__keywords = self.__freeze(self.Keywords[index])
+        header.__names = self.__freeze(self.Names[index])
+        header.__num = self.__freeze(self.Num[index])
+        header.Unit = np.array(self.Unit)[index]
+        return header
 
     def names(self) -> List[str]:
         return list(self.Names)
@@ -141,9 +350,11 @@ class SUMMARYHeader:
         new = deepcopy(self)
 
         if obj_name is not None:
+            names = new.Names.copy()
             for new_name, old_names in obj_name.items():
                 for on in old_names:
-                    new.Names[new.Names == on] = new_name
+                    names[names == on] = new_name
+            new.Names = names
 
         """
         if num_name is not None:
@@ -183,11 +394,10 @@ class SUMMARYHeader:
         )
 
     def get_group_index(self, key: str) -> np.ndarray:
-        df = self.to_dataframe()
         if key.lower() == "seg":
-            return df["Keyword"].str.contains(r"\bS.*", regex=True).values
+            return self.__match("S*", "keywords")
         if key.lower() == "wel":
-            return df["Keyword"].str.contains(r"\bW.*", regex=True).values
+            return self.__match("W*", "keywords")
         else:
             raise KeyError
 
@@ -271,18 +481,16 @@ class SUMMARY(EclipseBinaryData):
                     yield self.get(key, name, num)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__} {self.Values.shape}"
+        return f"{self.__class__.__name__} {self.shape}"
 
     def get(
         self,
-        keywords: Union[Iterable[str], str] = None,
-        names: Union[Iterable[str], str] = None,
-        num: Union[Iterable[str], str] = None,
+        keywords: Optional[Union[Iterable[str], str]] = None,
+        names: Optional[Union[Iterable[str], str]] = None,
+        num: Optional[Union[Iterable[str], str]] = None,
     ) -> SUMMARY:
         index = self.Header.index(keywords, names, num)
-        new_df = self.Values[:, index]
-        new_header = self.Header.new(index)
-        return SUMMARY(self.CalcName, new_df, self.TimeVector, new_header)
+        return self.get_from_index(index)
 
     def get_group(self, key: str) -> SUMMARY:
         if key.lower() == "seg":
@@ -292,10 +500,11 @@ class SUMMARY(EclipseBinaryData):
             index = self.Header.get_group_index("wel")
             return self.get_from_index(index)
 
-    def get_from_index(self, index: np.ndarray) -> SUMMARY:
-        new_df = self.Values[:, index]
-        new_header = self.Header.new(index)
-        return SUMMARY(self.CalcName, new_df, self.TimeVector, new_header)
+    def select(self, *patterns: str) -> SUMMARY:
+        return self.get_from_index(self.Header.select(*patterns))
+
+    def get_from_index(self, index: np.ndarray) -> SummaryView:
+        return SummaryView(self, index)
 
     def get_request(
         self,
@@ -371,7 +580,7 @@ class SUMMARY(EclipseBinaryData):
         return i, j
 
     def get_well_names(self) -> List[str]:
-        return pd.unique(self.Header.well_name())
+        return self.Header.well_name()
 
     def get_group_name(self) -> List[str]:
         return self.Header.group_name()
@@ -384,21 +593,26 @@ class SUMMARY(EclipseBinaryData):
         new_sname: Iterable,
     ) -> SUMMARY:
         new = self
-        new.Header.Num = self.Header.Num.astype(str)
         num = self.Header.Num.astype(str)
         name = self.Header.Names.astype(str)
+        new_num = num.copy()
+        new_name = self.Header.Names.copy()
         for ow, nw, os, ns in zip(old_wname, new_wname, old_sname, new_sname):
-            new.Header.Names[(name == str(ow)) & (num == str(os))] = str(nw)
-            new.Header.Num[(name == str(ow)) & (num == str(os))] = ns
+            new_name[(name == str(ow)) & (num == str(os))] = str(nw)
+            new_num[(name == str(ow)) & (num == str(os))] = ns
 
+        new.Header.Names = new_name
+        new.Header.Num = new_num
         return new
 
     def replace_name_2(self, old_wname: Iterable, new_wname: Iterable) -> SUMMARY:
         new = deepcopy(self)
         new.Header.Num = self.Header.Num.astype(str)
         name = self.Header.Names.astype(str)
+        new_name = new.Header.Names.copy()
         for ow, nw in zip(old_wname, new_wname):
-            new.Header.Names[name == str(ow)] = str(nw)
+            new_name[name == str(ow)] = str(nw)
+        new.Header.Names = new_name
         return new
 
     def replace_name(
@@ -410,31 +624,25 @@ class SUMMARY(EclipseBinaryData):
         return SUMMARY(self.CalcName, self.Values, self.TimeVector, new_header)
 
     def compact(self) -> SUMMARY:
-        new = deepcopy(self)
-        df = self.Header.duplicated()
-        duplicate_df = df[df["Duplicate"]]
-        uniq_duplicate = duplicate_df[["Keyword", "Name", "Num"]].drop_duplicates()
-        for_del = []
-        for rid, row in uniq_duplicate.iterrows():
-            target_df = duplicate_df[
-                (duplicate_df["Keyword"] == row["Keyword"])
-                & (duplicate_df["Name"] == row["Name"])
-                & (duplicate_df["Num"] == row["Num"])
-            ]
-            target_value = self.Values[:, target_df.index.values]
-            new_value = np.sum(target_value, axis=1)
-            new.Values[:, rid] = new_value
-            target_for_del = target_df[target_df.index.values != rid]
-            for_del.extend(target_for_del.index.values)
-            pass
-        pattern = np.ones(self.Values.shape[1]).astype(bool)
-        pattern[for_del] = False
-        new.Values = new.Values[:, pattern]
-        new.Header.Names = new.Header.Names[pattern]
-        new.Header.Num = new.Header.Num[pattern]
-        new.Header.Unit = new.Header.Unit[pattern]
-        new.Header.Keywords = new.Header.Keywords[pattern]
-        return new
+        header = self.Header
+        duplicate_codes = header.factorize(unit=True)
+        duplicate = np.bincount(duplicate_codes)[duplicate_codes] > 1
+
+        codes = header.factorize()
+        codes[~duplicate] = np.arange(np.count_nonzero(~duplicate)) + len(codes)
+        keep = np.unique(codes, return_index=True)[1]
+        keep.sort()
+
+        values = self.Values[:, keep]
+        columns = np.flatnonzero(duplicate)
+        if len(columns) > 0:
+            order = columns[np.argsort(codes[columns], kind="stable")]
+            starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+            sums = np.add.reduceat(self.Values[:, order], starts, axis=1)
+            targets = np.searchsorted(keep, order[starts])
+            values[:, targets] = sums
+
+        return SUMMARY(self.CalcName, values, self.TimeVector, header.new(keep))
 
     def split(
         self,
@@ -445,27 +653,168 @@ class SUMMARY(EclipseBinaryData):
 
         fsummary = FieldSUMMARY(self.CalcName)
 
+        header = self.Header
+        name_columns = header.group_columns("names")
+        wel = header.get_group_index("wel")
+        segment = header.get_group_index("seg")
+
+        bore_masks = []
+        if not (seg is None or bore is None or well is None):
+            for bname in pd.unique(bore):
+                bore_mask = np.zeros(len(header.Keywords), dtype=bool)
+                bore_mask[header.index(num=seg[bore == bname])] = True
+                bore_masks.append((bname, bore_mask))
+
         for wname in self.get_well_names():
-            all_well_summary = self.get(keywords=None, names=wname, num=None)
+            columns = name_columns[str(wname)]
+            wh_summary = WellHeadSUMMARY(SummaryView(self, columns[wel[columns]]))
 
-            if not (seg is None or bore is None or well is None):
+            if bore_masks:
                 bore_summarys = []
-                for bname in pd.unique(bore):
-                    bore_seg = seg[bore == bname]
-                    bore_data = all_well_summary.get(num=bore_seg)
+                for bname, bore_mask in bore_masks:
+                    bore_data = SummaryView(self, columns[bore_mask[columns]])
                     bore_summarys.append(BoreSummary(bname, bore_data))
-                wh_summary = WellHeadSUMMARY(all_well_summary.get_group("wel"))
                 well_summary = WellSUMMARY(wname, wh_summary, bore_summarys, None)
 
             else:
-                wh_summary = WellHeadSUMMARY(all_well_summary.get_group("wel"))
-                s_summary = SegmentSUMMARY(all_well_summary.get_group("seg"))
+                s_summary = SegmentSUMMARY(SummaryView(self, columns[segment[columns]]))
                 well_summary = WellSUMMARY(wname, wh_summary, None, s_summary)
 
             fsummary.append(well_summary)
         return fsummary
 
 
+class SummaryView(SUMMARY):
+    """
+    Columns of a parent SUMMARY without copying them. Views of views refer
+    to the same parent. The first access to '.Values' (or 'materialize()')
+    copies the columns into a writable array that the view keeps: it is a
+    snapshot, later changes of the parent are not seen and changes of the
+    view do not reach the parent. 'values_view()' returns read-only values
+    read through from the parent without a copy. Selections ('get',
+    'get_group', 'select') are resolved on the parent header, so chained
+    selections do not build the headers of intermediate views.
+    """
+
+    def __init__(self, parent: SUMMARY, index: np.ndarray) -> None:
+        index = np.asarray(index)
+        if index.dtype == bool:
+            index = np.flatnonzero(index)
+        else:
+            index = index.astype(np.intp, copy=False)
+        if (
+            isinstance(parent, SummaryView)
+            and not parent.is_materialized
+            and not parent.__own_header
+        ):
+            index = parent.Index[index]
+            parent = parent.Parent
+
+        self.Parent: SUMMARY = parent
+        self.Index: np.ndarray = index
+        self.CalcName = parent.CalcName
+        self.TimeVector = parent.TimeVector
+        self.__columns = self.__to_columns(index)
+        self.__values: Optional[np.ndarray] = None
+        self.__header: Optional[SUMMARYHeader] = None
+        self.__own_header: bool = False
+
+    @staticmethod
+    def __to_columns(index: np.ndarray) -> Union[slice, np.ndarray]:
+        if len(index) > 0 and np.all(np.diff(index) == 1):
+            return slice(index[0], index[-1] + 1)
+        return index
+
+    def __copy__(self) -> SummaryView:
+        new = SummaryView(self.Parent, self.Index)
+        new.__values = self.__values
+        new.__header = self.__header
+        new.__own_header = self.__own_header
+        return new
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        values = self.__take() if self.__values is None else self.__values
+        parent = SUMMARY(self.CalcName, values, self.TimeVector, self.Header)
+        return SummaryView, (parent, np.arange(values.shape[1]))
+
+    def __take(self) -> np.ndarray:
+        values: np.ndarray = self.Parent.Values[:, self.__columns]
+        return values
+
+    def __local(self, columns: np.ndarray) -> np.ndarray:
+        columns = np.asarray(columns)
+        if columns.dtype == bool:
+            return np.flatnonzero(columns[self.Index])
+        return np.flatnonzero(np.isin(self.Index, columns))
+
+    def get(
+        self,
+        keywords: Optional[Union[Iterable[str], str]] = None,
+        names: Optional[Union[Iterable[str], str]] = None,
+        num: Optional[Union[Iterable[str], str]] = None,
+    ) -> SUMMARY:
+        if self.__own_header:
+            return super().get(keywords, names, num)
+        columns = self.Parent.Header.index(keywords, names, num)
+        return self.get_from_index(self.__local(columns))
+
+    def get_group(self, key: str) -> SUMMARY:
+        if self.__own_header or key.lower() not in ("seg", "wel"):
+            return super().get_group(key)
+        columns = self.Parent.Header.get_group_index(key)
+        return self.get_from_index(self.__local(columns))
+
+    def select(self, *patterns: str) -> SUMMARY:
+        if self.__own_header:
+            return super().select(*patterns)
+        columns = self.Parent.Header.select(*patterns)
+        return self.get_from_index(self.__local(columns))
+
+    @property
+    def is_materialized(self) -> bool:
+        return self.__values is not None
+
+    def materialize(self) -> SummaryView:
+        if self.__values is None:
+            self.__values = np.array(self.__take())
+        return self
+
+    def values_view(self) -> np.ndarray:
+        if self.__values is not None:
+            values = self.__values.view()
+        else:
+            values = self.__take().view()
+        values.flags.writeable = False
+        return values
+
+    @property
+    def Values(self) -> np.ndarray:
+        if self.__values is None:
+            self.__values = np.array(self.__take())
+        return self.__values
+
+    @Values.setter
+    def Values(self, values: np.ndarray) -> None:
+        self.__values = values
+
+    @property
+    def Header(self) -> SUMMARYHeader:
+        if self.__header is None:
+            self.__header = self.Parent.Header.new(self.Index)
+        return self.__header
+
+    @Header.setter
+    def Header(self, header: SUMMARYHeader) -> None:
+        self.__header = header
+        self.__own_header = True
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        if self.__values is not None:
+            return super().shape
+        return self.Parent.shape[0], len(self.Index)
+
+
 class FieldSUMMARY:
     def __init__(
         self,
@@ -640,4 +989,6 @@ class SegmentSUMMARY:
 
 
 class SUMMARYList(list):
-    pass
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.Errors: Dict[Path, str] = dict()
@@ -3,9 +3,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import List, Union, Dict, Any, Tuple, Optional, Iterable
+    from typing import List, Union, Dict, Any, Tuple, Optional, Iterable, Iterator
 
-from .BinaryData import EclipseBinaryData
+from .BinaryData import EclipseBinaryData, BinaryData
 
 import numpy as np
 import pandas as pd
@@ -17,10 +17,15 @@ from copy import deepcopy
 
 
 class UNRSTRSSPEC(EclipseBinaryData):
+
+    __day_id = 64
+    __month_id = 65
+    __year_id = 66
+
     def __init__(
         self,
-        unrst: Optional[EclipseBinaryData],
-        rsspec: Optional[EclipseBinaryData],
+        unrst: BinaryData,
+        rsspec: Optional[BinaryData],
     ) -> None:
         self.UNRST = unrst
         self.RSSPEC = rsspec
@@ -32,3 +37,45 @@ class UNRSTRSSPEC(EclipseBinaryData):
             return getattr(self.RSSPEC, item)
         else:
             raise super().__getattribute__(item)
+
+    @property
+    def steps(self) -> np.ndarray:
+        return np.ravel(self.UNRST.SEQNUM).astype(int)
+
+    @property
+    def dates(self) -> Time:
+        intehead = np.atleast_2d(self.UNRST.INTEHEAD)
+        days = intehead[:, self.__day_id]
+        months = intehead[:, self.__month_id]
+        years = intehead[:, self.__year_id]
+        dates = [f"{y:04d}-{m:02d}-{d:02d}" for d, m, y in zip(days, months, years)]
+        return Time(np.array(dates, dtype="datetime64[ms]"))
+
+    def __occurrence_steps(self, keyword: str) -> np.ndarray:
+        seqnum_positions = self.UNRST.positions("SEQNUM")
+        keyword_positions = self.UNRST.positions(keyword)
+        step_id = np.searchsorted(seqnum_positions, keyword_positions) - 1
+        if np.any(step_id < 0):
+            raise ValueError(f"{keyword} is written before the first SEQNUM")
+        steps: np.ndarray = self.steps[step_id]
+        return steps
+
+    def __get_occurrence(self, keyword: str, occurrence: int) -> np.ndarray:
+        values: np.ndarray = self.UNRST.get(keyword, occurrence)
+        return values
+
+    def get(self, keyword: str, step: int) -> np.ndarray:
+        occurrences = np.flatnonzero(self.__occurrence_steps(keyword) == step)
+        if len(occurrences) == 0:
+            raise KeyError(f"{keyword} is not written at report step {step}")
+        return self.__get_occurrence(keyword, occurrences[0])
+
+    def iter_steps(
+        self,
+        keyword: str,
+        steps: Optional[Iterable[int]] = None,
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        occurrence_steps = self.__occurrence_steps(keyword)
+        for occurrence, step in enumerate(occurrence_steps):
+            if steps is None or step in steps:
+                yield int(step), self.__get_occurrence(keyword, occurrence)
@@ -1,4 +1,6 @@
-from .BinaryData import BinaryData, EclipseBinaryData
-from .Summary import SUMMARY, SUMMARYHeader
+from .BinaryData import BinaryData, EclipseBinaryData, LazyBinaryData
+from .Summary import SUMMARY, SUMMARYHeader, SummaryView
 from .Init import INIT
 from .UnrstRsspec import UNRSTRSSPEC
+from .Grid import EGRID, GridGeometry
+from .ActiveIndex import ActiveIndex
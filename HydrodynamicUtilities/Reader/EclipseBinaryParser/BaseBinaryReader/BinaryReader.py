@@ -1,15 +1,24 @@
 import os
+import mmap
 from struct import unpack
-from typing import Dict, BinaryIO, Iterator
-from .Header import HeaderConstructor, Header
-from .Content import Content
+from typing import Dict, BinaryIO, Iterator, Iterable, Tuple, Optional, List, Union
+from .Header import HeaderConstructor, Header, BinaryHeaderWorker
+from .Content import Content, DecodePolicy
+from .Index import KeywordIndex
+from .IndexCache import IndexCache
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from copy import copy
 import time
 
+import numpy as np
+
 
 class RowBinaryData:
     def __init__(self) -> None:
         self.data: Dict[str, Content] = dict()
+        self.index = KeywordIndex()
 
     def __getitem__(self, key: str) -> Content:
         value: Content = self.data[key]
@@ -20,6 +29,7 @@ class RowBinaryData:
             yield self.data[key]
 
     def append(self, content: Content) -> None:
+        self.index.append(content.header)
         if content.keyword in self.data.keys():
             self.data[content.keyword].append(content.values[0])
         else:
@@ -30,8 +40,84 @@ class BinaryReader:
     determinant: int = 4  # 4 is size of zone(area) length determinant
 
     @classmethod
-    def read_area(cls, file: BinaryIO, header: Header) -> bytes:
+    def strip_determinants(
+        cls,
+        raw: np.ndarray,
+        header: Header,
+        out: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        if len(raw) != header.expected_length_area:
+            return None
+
+        det = cls.determinant
+        size_area = header.length_one_obj * header.number_per_area
+        number_full = header.length_block // size_area
+        size_last = header.length_block - number_full * size_area
+        step = size_area + 2 * det
+        end_full = number_full * step
+
+        if number_full > 0:
+            heads: np.ndarray = np.ndarray((number_full,), ">i4", raw, 0, (step,))
+            tails: np.ndarray = np.ndarray(
+                (number_full,), ">i4", raw, step - det, (step,)
+            )
+            if not (np.all(heads == size_area) and np.all(tails == size_area)):
+                return None
+
+        if size_last > 0:
+            head = raw[end_full : end_full + det].view(">i4")[0]
+            tail = raw[-det:].view(">i4")[0]
+            if head != size_last or tail != size_last:
+                return None
+
+        if header.number_areas <= 1:
+            if out is None:
+                return raw[det : det + header.length_block]
+            out[:] = raw[det : det + header.length_block]
+            return out
+
+        area = np.empty(header.length_block, dtype=np.uint8) if out is None else out
+        length_full = number_full * size_area
+        full = raw[:end_full].reshape(number_full, step)
+        area[:length_full].reshape(number_full, size_area)[:] = full[:, det:-det]
+        area[length_full:] = raw[end_full + det : end_full + det + size_last]
+        return area
+
+    @staticmethod
+    def area_targets(headers: Iterable[Header]) -> List[Optional[np.ndarray]]:
+        """
+        One output buffer per keyword that has a multi-block record, sized
+        from the index; each record gets its slice, so stripping the markers
+        is the only copy and the records join without another one. Keywords
+        of single-block records get None and stay views of the mapped file.
+        """
+        headers = list(headers)
+        keywords: Dict[str, List[int]] = dict()
+        for header_id, header in enumerate(headers):
+            keywords.setdefault(header.keyword, list()).append(header_id)
+
+        targets: List[Optional[np.ndarray]] = [None] * len(headers)
+        for header_ids in keywords.values():
+            if all(headers[i].number_areas <= 1 for i in header_ids):
+                continue
+            size = sum(headers[i].length_block for i in header_ids)
+            buffer = np.empty(size, dtype=np.uint8)
+            start = 0
+            for header_id in header_ids:
+                end = start + headers[header_id].length_block
+                targets[header_id] = buffer[start:end]
+                start = end
+        return targets
+
+    @classmethod
+    def read_area(cls, file: BinaryIO, header: Header) -> np.ndarray:
+        start = file.tell()
+        raw = np.frombuffer(file.read(header.expected_length_area), dtype=np.uint8)
+        area = cls.strip_determinants(raw, header)
+        if area is not None:
+            return area
 
+        file.seek(start)
         read = 0
         bytes_list = []
         while read < header.length_block:
@@ -40,16 +126,432 @@ class BinaryReader:
             file.seek(cls.determinant, 1)
             read += size_area
 
-        return b"".join(bytes_list)
+        return np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
+
+    @classmethod
+    def skip_area(cls, file: BinaryIO, header: Header) -> int:
+        start = file.tell()
+        expected = header.expected_length_area
+        if header.number_obj > 0:
+            file.seek(start + expected - cls.determinant)
+            size_area = header.length_one_obj * header.number_per_area
+            last = header.length_block % size_area
+            if last == 0:
+                last = size_area
+            determinant = file.read(cls.determinant)
+            if len(determinant) == cls.determinant:
+                if unpack(">i", determinant)[0] == last:
+                    return expected
+
+        file.seek(start)
+        read = 0
+        while read < header.length_block:
+            size_area = unpack(">i", file.read(cls.determinant))[0]
+            file.seek(size_area + cls.determinant, 1)
+            read += size_area
+        return file.tell() - start
+
+    @classmethod
+    def map_area(
+        cls,
+        buffer: np.ndarray,
+        position: int,
+        header: Header,
+        out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, int]:
+        end = position + header.expected_length_area
+        area = cls.strip_determinants(buffer[position:end], header, out)
+        if area is not None:
+            return area, end
+
+        read = 0
+        areas = []
+        while read < header.length_block:
+            marker = buffer[position : position + cls.determinant]
+            size_area = int(marker.view(">i4")[0])
+            position += cls.determinant
+            areas.append(buffer[position : position + size_area])
+            position += size_area + cls.determinant
+            read += size_area
+
+        if out is not None and read == len(out):
+            start = 0
+            for area in areas:
+                out[start : start + len(area)] = area
+                start += len(area)
+            return out, position
+        elif len(areas) == 1:
+            return areas[0], position
+        elif len(areas) == 0:
+            return buffer[position:position], position
+        else:
+            return np.concatenate(areas), position
+
+    @classmethod
+    def map_skip(cls, buffer: np.ndarray, position: int, header: Header) -> int:
+        end = position + header.expected_length_area
+        if header.number_obj > 0 and end <= len(buffer):
+            size_area = header.length_one_obj * header.number_per_area
+            last = header.length_block % size_area
+            if last == 0:
+                last = size_area
+            if int(buffer[end - cls.determinant : end].view(">i4")[0]) == last:
+                return end
+
+        read = 0
+        while read < header.length_block:
+            marker = buffer[position : position + cls.determinant]
+            size_area = int(marker.view(">i4")[0])
+            position += size_area + 2 * cls.determinant
+            read += size_area
+        return position
+
+    @staticmethod
+    def map_file(link: Path) -> np.ndarray:
+        if os.path.getsize(link) == 0:
+            return np.zeros(0, dtype=np.uint8)
+
+        with open(link, "rb") as file:
+            memory = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(memory, dtype=np.uint8)
+
+    @classmethod
+    def map_all_file(cls, link: Path) -> RowBinaryData:
+        index = KeywordIndex()
+        stamp = IndexCache.stamp(link)
+        buffer = cls.map_file(link)
+
+        position = 0
+        while position < len(buffer):
+            header = HeaderConstructor.create(
+                "memory map",
+                buffer=buffer,
+                position=position,
+            )
+            header.position = position + BinaryHeaderWorker.length_header
+            position = cls.map_skip(buffer, header.position, header)
+            header.length_area = position - header.position
+            index.append(header)
+
+        IndexCache.save(link, index, stamp)
+        return cls.map_index(buffer, index)
+
+    @classmethod
+    def map_index(cls, buffer: np.ndarray, index: KeywordIndex) -> RowBinaryData:
+        data = RowBinaryData()
+        for header, out in zip(index, cls.area_targets(index)):
+            area = cls.map_area(buffer, header.position, header, out)[0]
+            data.append(Content(header, area))
+        return data
+
+    @classmethod
+    def read_index(
+        cls,
+        link: Path,
+        index: KeywordIndex,
+        use_mmap: bool = False,
+        threads: Optional[int] = None,
+    ) -> RowBinaryData:
+        if threads is not None and threads > 1:
+            return cls.read_index_threaded(link, index, use_mmap, threads)
+
+        if use_mmap:
+            return cls.map_index(cls.map_file(link), index)
+
+        data = RowBinaryData()
+        with open(link, "rb") as file:
+            for header in index:
+                file.seek(header.position)
+                data.append(Content(header, cls.read_area(file, header)))
+        return data
+
+    @staticmethod
+    def split_index(index: KeywordIndex, number: int) -> List[List[Header]]:
+        sizes = np.array([header.length_area for header in index], dtype=np.int64)
+        bounds = np.cumsum(sizes) * number // max(int(sizes.sum()), 1)
+        chunks: List[List[Header]] = [list() for _ in range(number)]
+        for header, chunk_id in zip(index, np.minimum(bounds, number - 1)):
+            chunks[chunk_id].append(header)
+        return [chunk for chunk in chunks if len(chunk) > 0]
+
+    @classmethod
+    def read_headers(
+        cls,
+        link: Path,
+        headers: List[Header],
+        buffer: Optional[np.ndarray] = None,
+        targets: Optional[List[Optional[np.ndarray]]] = None,
+    ) -> List[np.ndarray]:
+        if buffer is not None:
+            if targets is None:
+                targets = [None] * len(headers)
+            return [
+                cls.map_area(buffer, h.position, h, out)[0]
+                for h, out in zip(headers, targets)
+            ]
+
+        areas = []
+        with open(link, "rb") as file:
+            for header in headers:
+                file.seek(header.position)
+                areas.append(cls.read_area(file, header))
+        return areas
 
     @classmethod
-    def read_all_file(cls, link: Path) -> RowBinaryData:
+    def read_index_threaded(
+        cls,
+        link: Path,
+        index: KeywordIndex,
+        use_mmap: bool,
+        threads: int,
+    ) -> RowBinaryData:
+        buffer = cls.map_file(link) if use_mmap else None
+        chunks = cls.split_index(index, threads)
+        targets: Dict[int, Optional[np.ndarray]] = dict()
+        if buffer is not None:
+            targets = dict(zip(map(id, index), cls.area_targets(index)))
+
         data = RowBinaryData()
+        with ThreadPoolExecutor(threads) as executor:
+            tasks = [
+                executor.submit(
+                    cls.read_headers,
+                    link,
+                    chunk,
+                    buffer,
+                    [targets.get(id(header)) for header in chunk],
+                )
+                for chunk in chunks
+            ]
+            for chunk, task in zip(chunks, tasks):
+                for header, area in zip(chunk, task.result()):
+                    data.append(Content(header, area))
+        return data
+
+    @classmethod
+    def index_file(cls, link: Path) -> KeywordIndex:
+        index = IndexCache.load(link)
+        if index is not None:
+            return index
+
+        index = KeywordIndex()
+        stamp = IndexCache.stamp(link)
 
+        with open(link, "rb") as file:
+            file_size = stamp["size"]
+            while file.tell() < file_size:
+                header = HeaderConstructor.create("binary file", file=file)
+                header.position = file.tell()
+                header.length_area = cls.skip_area(file, header)
+                index.append(header)
+
+        IndexCache.save(link, index, stamp)
+        return index
+
+    @classmethod
+    def read_keyword(
+        cls,
+        link: Path,
+        index: KeywordIndex,
+        keyword: str,
+        use_mmap: bool = False,
+        occurrence: Optional[int] = None,
+        buffer: Optional[np.ndarray] = None,
+    ) -> Content:
+        if occurrence is None:
+            headers = index[keyword]
+        else:
+            headers = [index[keyword][occurrence]]
+        if use_mmap and buffer is None:
+            buffer = cls.map_file(link)
+        if buffer is not None:
+            targets = cls.area_targets(headers)
+            areas = [
+                cls.map_area(buffer, h.position, h, out)[0]
+                for h, out in zip(headers, targets)
+            ]
+        else:
+            areas = []
+            with open(link, "rb") as file:
+                for header in headers:
+                    file.seek(header.position)
+                    areas.append(cls.read_area(file, header))
+
+        content = Content(headers[0], areas[0])
+        for area in areas[1:]:
+            content.append(area)
+        return content
+
+    @classmethod
+    def iter_records(
+        cls,
+        link: Path,
+        keywords: Optional[Iterable[str]] = None,
+        policy: Optional[DecodePolicy] = None,
+    ) -> Iterator[Tuple[Header, Union[np.ndarray, List[str]]]]:
+        if keywords is not None:
+            keywords = set(keywords)
+
+        count: Dict[str, int] = dict()
         with open(link, "rb") as file:
             file_size = os.path.getsize(link)
             while file.tell() < file_size:
                 header = HeaderConstructor.create("binary file", file=file)
+                header.position = file.tell()
+                header.occurrence = count.get(header.keyword, 0)
+                count[header.keyword] = header.occurrence + 1
+                if keywords is None or header.keyword in keywords:
+                    byte = cls.read_area(file, header)
+                    header.length_area = file.tell() - header.position
+                    yield header, Content(header, byte).decode(policy)
+                else:
+                    header.length_area = cls.skip_area(file, header)
+
+    @classmethod
+    def column_offsets(cls, header: Header, columns: np.ndarray) -> np.ndarray:
+        size_area = header.length_one_obj * header.number_per_area
+        step = size_area + 2 * cls.determinant
+        area_id, column_id = np.divmod(columns, header.number_per_area)
+        offsets: np.ndarray = (
+            area_id * step + cls.determinant + column_id * header.length_one_obj
+        )
+        byte_id = np.arange(header.length_one_obj)
+        byte_offsets: np.ndarray = offsets[:, np.newaxis] + byte_id[np.newaxis, :]
+        return byte_offsets.ravel()
+
+    @classmethod
+    def read_columns(
+        cls,
+        link: Path,
+        headers: List[Header],
+        columns: np.ndarray,
+        use_mmap: bool = False,
+    ) -> np.ndarray:
+        columns = np.asarray(columns, dtype=np.int64)
+        if len(headers) == 0:
+            return np.zeros((0, len(columns)))
+
+        first = headers[0]
+        length_row = len(columns) * first.length_one_obj
+        results = np.empty((len(headers), length_row), dtype=np.uint8)
+        offsets: Dict[int, np.ndarray] = dict()
+        buffer = cls.map_file(link) if use_mmap else None
+
+        with open(link, "rb") as file:
+            for row, header in enumerate(headers):
+                start = header.position
+                if header.length_area != header.expected_length_area:
+                    if buffer is not None:
+                        area = cls.map_area(buffer, start, header)[0]
+                    else:
+                        file.seek(start)
+                        area = cls.read_area(file, header)
+                    area = area.reshape(-1, header.length_one_obj)
+                    results[row] = area[columns].ravel()
+                    continue
+
+                if header.number_obj not in offsets:
+                    offsets[header.number_obj] = cls.column_offsets(header, columns)
+
+                if buffer is not None:
+                    raw = buffer[start : start + header.length_area]
+                else:
+                    file.seek(start)
+                    raw = np.frombuffer(file.read(header.length_area), dtype=np.uint8)
+                results[row] = raw[offsets[header.number_obj]]
+
+        values: np.ndarray = results.view(">" + first.ConvertorFormat)
+        return values
+
+    @classmethod
+    def read_all_file(
+        cls,
+        link: Path,
+        use_mmap: bool = False,
+        threads: Optional[int] = None,
+    ) -> RowBinaryData:
+        if threads is not None and threads > 1:
+            return cls.read_index(link, cls.index_file(link), use_mmap, threads)
+
+        index = IndexCache.load(link)
+        if index is not None:
+            return cls.read_index(link, index, use_mmap)
+
+        if use_mmap:
+            return cls.map_all_file(link)
+
+        data = RowBinaryData()
+        index = KeywordIndex()
+        stamp = IndexCache.stamp(link)
+
+        with open(link, "rb") as file:
+            file_size = stamp["size"]
+            while file.tell() < file_size:
+                header = HeaderConstructor.create("binary file", file=file)
+                header.position = file.tell()
                 byte = cls.read_area(file, header)
+                header.length_area = file.tell() - header.position
+                index.append(header)
                 data.append(Content(header, byte))
+
+        IndexCache.save(link, index, stamp)
+        return data
+
+    @staticmethod
+    def get_file_threads(links: List[Path], threads: Optional[int] = None) -> int:
+        if threads is None:
+            threads = min(len(links), os.cpu_count() or 1)
+        return max(threads, 1)
+
+    @classmethod
+    def read_all_files(
+        cls,
+        links: List[Path],
+        use_mmap: bool = False,
+        threads: Optional[int] = None,
+    ) -> RowBinaryData:
+        threads = cls.get_file_threads(links, threads)
+        with ThreadPoolExecutor(threads) as executor:
+            task = partial(cls.read_all_file, use_mmap=use_mmap)
+            parts = list(executor.map(task, links))
+
+        data = RowBinaryData()
+        offset = 0
+        for link, part in zip(links, parts):
+            for header in part.index:
+                value = part[header.keyword].values[header.occurrence]
+                shifted = copy(header)
+                shifted.position += offset
+                data.append(Content(shifted, value))
+            offset += os.path.getsize(link)
         return data
+
+    @classmethod
+    def index_files(
+        cls,
+        links: List[Path],
+        threads: Optional[int] = None,
+    ) -> List[KeywordIndex]:
+        threads = cls.get_file_threads(links, threads)
+        with ThreadPoolExecutor(threads) as executor:
+            return list(executor.map(cls.index_file, links))
+
+
+class FileMaps:
+    """
+    Memory maps of the files behind a lazy loader: each file is mapped on
+    its first keyword and the map is reused for the following ones.
+    """
+
+    def __init__(self) -> None:
+        self.__buffers: Dict[Path, np.ndarray] = dict()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {len(self.__buffers)}"
+
+    def get(self, link: Path) -> np.ndarray:
+        buffer = self.__buffers.get(link)
+        if buffer is None:
+            buffer = BinaryReader.map_file(link)
+            self.__buffers[link] = buffer
+        return buffer
@@ -1,12 +1,27 @@
-from typing import List, Any, Union
+from typing import List, Any, Union, Optional
 from .Header import Header
 import numpy as np
 
 
+class DecodePolicy:
+    """
+    native: numeric keywords are converted to native byte order on decode.
+    float_type: "float32" keeps REAL keywords single precision, "float64"
+    upcasts them; None leaves them as stored.
+    """
+
+    def __init__(self, native: bool = False, float_type: Optional[str] = None) -> None:
+        self.native = native
+        self.float_type = float_type
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {self.native} {self.float_type}"
+
+
 class Content:
-    def __init__(self, header: Header, value: bytes) -> None:
+    def __init__(self, header: Header, value: Union[bytes, np.ndarray]) -> None:
         self.header: Header = header
-        self.values: List[bytes] = [value]
+        self.values: List[Union[bytes, np.ndarray]] = [value]
 
     def __eq__(self, other: Any) -> bool:
         try:
@@ -21,35 +36,112 @@ class Content:
     def keyword(self) -> str:
         return self.header.keyword
 
-    def append(self, value: bytes) -> None:
+    def append(self, value: Union[bytes, np.ndarray]) -> None:
         self.values.append(value)
 
-    def decode(self) -> Union[np.ndarray, List[str]]:
+    def join(self) -> Union[bytes, np.ndarray]:
+        if len(self.values) == 1:
+            return self.values[0]
+
+        chunks = [value for value in self.values if isinstance(value, bytes)]
+        if len(chunks) == len(self.values):
+            return b"".join(chunks)
+
+        arrays: List[np.ndarray] = [
+            value if isinstance(value, np.ndarray) else np.frombuffer(value, np.uint8)
+            for value in self.values
+        ]
+        joined = self.adjacent(arrays)
+        if joined is None:
+            joined = np.concatenate(arrays)
+        return joined
+
+    @staticmethod
+    def adjacent(arrays: List[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        The span of a shared byte buffer if the arrays are consecutive
+        slices of it, as the reader lays out records of one keyword.
+        """
+        base = arrays[0].base
+        if not isinstance(base, np.ndarray) or base.ndim != 1:
+            return None
+        if base.dtype != np.uint8 or not base.flags.c_contiguous:
+            return None
+
+        origin = base.__array_interface__["data"][0]
+        start = arrays[0].__array_interface__["data"][0]
+        end = start
+        for array in arrays:
+            if array.base is not base or array.dtype != np.uint8:
+                return None
+            if array.ndim != 1 or not array.flags.c_contiguous:
+                return None
+            if array.__array_interface__["data"][0] != end:
+                return None
+            end += len(array)
+        joined: np.ndarray = base[start - origin : end - origin]
+        return joined
+
+    @staticmethod
+    def convert(
+        arraydata: np.ndarray,
+        policy: Optional[DecodePolicy] = None,
+    ) -> np.ndarray:
+        if policy is None:
+            return arraydata
+
+        if policy.float_type is not None and arraydata.dtype.kind == "f":
+            if arraydata.dtype.itemsize == 4:
+                return arraydata.astype(policy.float_type)
+        if policy.native and not arraydata.dtype.isnative:
+            return arraydata.astype(arraydata.dtype.newbyteorder("="))
+        return arraydata
+
+    def decode(self, policy: Optional[DecodePolicy] = None) -> np.ndarray:
         number_obj = self.header.number_obj
         conv_format = self.header.ConvertorFormat
         length = self.header.length_one_obj
 
-        data = b"".join(self.values)
-
-        if conv_format != "c":
-            arraydata: np.ndarray = np.frombuffer(data, dtype=">" + conv_format)
-            if number_obj > 0 and len(arraydata) > 0:
-                if int(len(arraydata) / number_obj) != 1:
-                    dual = (int(len(arraydata) / number_obj), number_obj)
-                    try:
-                        return np.reshape(arraydata, newshape=dual)
-                    except ValueError:
-                        return arraydata
-                else:
-                    single = number_obj
-                    return np.reshape(arraydata, newshape=single)
+        data = self.join()
+
+        if conv_format == "c":
+            return self.decode_strings(data, length)
 
+        if conv_format == "?":
+            arraydata: np.ndarray = np.frombuffer(data, dtype=">i4") != 0
+        else:
+            arraydata = np.frombuffer(data, dtype=">" + conv_format)
+            arraydata = self.convert(arraydata, policy)
+
+        if number_obj > 0 and len(arraydata) > 0:
+            if int(len(arraydata) / number_obj) != 1:
+                dual = (int(len(arraydata) / number_obj), number_obj)
+                try:
+                    return np.reshape(arraydata, newshape=dual)
+                except ValueError:
+                    return arraydata
             else:
-                return arraydata
+                single = number_obj
+                return np.reshape(arraydata, newshape=single)
 
         else:
-            string = data.decode("utf-8")
-            numwords = int(len(string) / length)
-            return list(
-                [string[w * length : (w + 1) * length].strip() for w in range(numwords)]
-            )
+            return arraydata
+
+    @staticmethod
+    def decode_strings(data: Union[bytes, np.ndarray], length: int) -> np.ndarray:
+        symbols = np.frombuffer(data, dtype=np.uint8)
+        numwords = len(symbols) // length
+        symbols = symbols[: numwords * length].reshape(numwords, length)
+
+        blank = (symbols == 32) | (symbols == 0)
+        trailing = np.logical_and.accumulate(blank[:, ::-1], axis=1)[:, ::-1]
+        symbols = np.where(trailing, 0, symbols).astype(np.uint8)
+        words = symbols.view(f"S{length}").ravel()
+
+        if numwords > 0 and blank[:, 0].any():
+            words = np.char.lstrip(words)
+
+        try:
+            return words.astype(str)
+        except UnicodeDecodeError:
+            return np.char.decode(words, "utf-8")
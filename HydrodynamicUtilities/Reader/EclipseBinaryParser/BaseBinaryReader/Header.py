@@ -1,5 +1,7 @@
 from struct import unpack
-from typing import BinaryIO, Any, Dict, Tuple
+from typing import BinaryIO, Any, Dict, Tuple, Optional
+
+import numpy as np
 
 
 class Header:
@@ -18,6 +20,10 @@ class Header:
         self.length_one_obj: int = length
         self.ConvertorFormat: str = convertor_format
 
+        self.__position: Optional[int] = None
+        self.__length_area: Optional[int] = None
+        self.occurrence: int = 0
+
     def __eq__(self, other: Any) -> bool:
         try:
             if self.keyword == other.keywords:
@@ -27,15 +33,55 @@ class Header:
         except:
             return False
 
+    @property
+    def position(self) -> int:
+        if self.__position is None:
+            raise ValueError(f"Position of {self.keyword} is not known")
+        return self.__position
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self.__position = value
+
+    @property
+    def length_area(self) -> int:
+        if self.__length_area is None:
+            raise ValueError(f"Area length of {self.keyword} is not known")
+        return self.__length_area
+
+    @length_area.setter
+    def length_area(self, value: int) -> None:
+        self.__length_area = value
+
     @property
     def length_block(self) -> int:
         return self.length_one_obj * self.number_obj
 
+    @property
+    def number_per_area(self) -> int:
+        if self.ConvertorFormat == "c":
+            return BinaryHeaderWorker.number_per_char_area
+        else:
+            return BinaryHeaderWorker.number_per_area
+
+    @property
+    def number_areas(self) -> int:
+        return -(-self.number_obj // self.number_per_area)
+
+    @property
+    def expected_length_area(self) -> int:
+        determinants = 2 * BinaryHeaderWorker.determinant * self.number_areas
+        return self.length_block + determinants
+
 
 class BinaryHeaderWorker:
 
     length_header: int = 24  # 24 is size of header
     significant_byte: int = 16  # 16 is size significant byte area of header
+    determinant: int = 4  # 4 is size of zone(area) length determinant
+
+    number_per_area: int = 1000  # numeric arrays are written by 1000 objects
+    number_per_char_area: int = 105  # char arrays are written by 105 objects
 
     lengths: Dict[str, int] = {
         "INTE": 4,
@@ -78,21 +124,32 @@ class BinaryHeaderReader(BinaryHeaderWorker):
         keyword = str(data[4:12], "utf-8").strip()
         numobjec = unpack(">i", data[12:16])[0]
         datatype = str(data[16:20], "utf-8")
-        length, dattyp = cls.__byte_init(datatype)
-        header = Header(keyword, numobjec, datatype, length, dattyp)
+        return cls.create(keyword, numobjec, datatype)
 
-        return header
+    @classmethod
+    def create(cls, keyword: str, number_of_objects: int, ecl_format: str) -> Header:
+        length, dattyp = cls.__byte_init(ecl_format)
+        return Header(keyword, number_of_objects, ecl_format, length, dattyp)
 
     @classmethod
     def header_from_file(cls, file: BinaryIO) -> Header:
         binary_header = file.read(cls.length_header)
         return cls.__header_from_bytes(binary_header)
 
+    @classmethod
+    def header_from_buffer(cls, buffer: np.ndarray, position: int) -> Header:
+        binary_header = buffer[position : position + cls.length_header].tobytes()
+        return cls.__header_from_bytes(binary_header)
+
 
 class HeaderConstructor:
     @classmethod
     def create(cls, method: str, **kwargs: Any) -> Header:
         if method == "binary file":
             return BinaryHeaderReader.header_from_file(kwargs["file"])
+        elif method == "memory map":
+            buffer = kwargs["buffer"]
+            position = kwargs["position"]
+            return BinaryHeaderReader.header_from_buffer(buffer, position)
         else:
             raise ImportError
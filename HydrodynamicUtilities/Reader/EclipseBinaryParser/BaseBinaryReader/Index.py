@@ -0,0 +1,38 @@
+from typing import Dict, List, Iterator, Iterable, Optional
+from .Header import Header
+
+
+class KeywordIndex:
+    def __init__(self, headers: Optional[Iterable[Header]] = None) -> None:
+        self.headers: List[Header] = list()
+        self.keywords: Dict[str, List[Header]] = dict()
+        if headers is not None:
+            for header in headers:
+                self.append(header)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {len(self.headers)}"
+
+    def __getitem__(self, keyword: str) -> List[Header]:
+        return self.keywords[keyword]
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.keywords
+
+    def __iter__(self) -> Iterator[Header]:
+        return iter(self.headers)
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+    def append(self, header: Header) -> None:
+        if header.keyword in self.keywords.keys():
+            header.occurrence = len(self.keywords[header.keyword])
+            self.keywords[header.keyword].append(header)
+        else:
+            header.occurrence = 0
+            self.keywords[header.keyword] = [header]
+        self.headers.append(header)
+
+    def keys(self) -> List[str]:
+        return list(self.keywords)
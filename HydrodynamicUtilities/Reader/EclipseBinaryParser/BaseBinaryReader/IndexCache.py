@@ -0,0 +1,95 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from .Header import BinaryHeaderReader
+from .Index import KeywordIndex
+
+
+class IndexCache:
+    """
+    The sidecar (CASE.UNRST.index or a hashed name in 'folder') is valid
+    while the size and the modification time of the file are unchanged.
+    Disabled by default; set 'enabled' (and preferably 'folder') to use it.
+    """
+
+    enabled: bool = False
+    folder: Optional[Path] = None
+    suffix: str = ".index"
+    version: int = 1
+
+    @classmethod
+    def path(cls, link: Path) -> Path:
+        if cls.folder is None:
+            return link.parent / (link.name + cls.suffix)
+        else:
+            full_path = str(Path(link).resolve()).encode("utf-8")
+            key = hashlib.sha1(full_path).hexdigest()[:16]
+            return Path(cls.folder) / f"{link.name}.{key}{cls.suffix}"
+
+    @classmethod
+    def stamp(cls, link: Path) -> Dict[str, int]:
+        stat = os.stat(link)
+        return {
+            "version": cls.version,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+        }
+
+    @classmethod
+    def load(cls, link: Path) -> Optional[KeywordIndex]:
+        if not cls.enabled:
+            return None
+
+        try:
+            with open(cls.path(link), "r") as file:
+                cache: Dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("stamp") != cls.stamp(link):
+            return None
+
+        index = KeywordIndex()
+        for keyword, number, ecl_format, position, length_area in cache["headers"]:
+            header = BinaryHeaderReader.create(keyword, number, ecl_format)
+            header.position = position
+            header.length_area = length_area
+            index.append(header)
+        return index
+
+    @classmethod
+    def save(cls, link: Path, index: KeywordIndex, stamp: Dict[str, int]) -> None:
+        """
+        'stamp' is taken before the scan; the index is not saved if the
+        file changed while it was scanned.
+        """
+        if not cls.enabled:
+            return None
+        if cls.stamp(link) != stamp:
+            return None
+
+        headers = [
+            (h.keyword, h.number_obj, h.EclipseFormat, h.position, h.length_area)
+            for h in index
+        ]
+        cache = {"stamp": stamp, "headers": headers}
+
+        path = cls.path(link)
+        temp = path.parent / (path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp, "w") as file:
+                json.dump(cache, file)
+            os.replace(temp, path)
+        except OSError:
+            pass
+
+    @classmethod
+    def clear(cls, link: Path) -> None:
+        try:
+            os.remove(cls.path(link))
+        except OSError:
+            pass
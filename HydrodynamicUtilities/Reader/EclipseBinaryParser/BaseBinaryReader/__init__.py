@@ -1,2 +1,5 @@
 from .BinaryReader import BinaryReader
 from .BinaryReader import RowBinaryData
+from .BinaryReader import FileMaps
+from .IndexCache import IndexCache
+from .Content import Content, DecodePolicy
@@ -3,39 +3,58 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Dict, Any, Union
+    from typing import Dict, Any, Union, Optional, Iterable, List
     from HydrodynamicUtilities.Models.EclipseBinaryFile import (
         SUMMARY,
         EclipseBinaryData,
     )
-    from .BaseBinaryReader import RowBinaryData
+    from .BaseBinaryReader import RowBinaryData, DecodePolicy
 
 
 import os
+import re
 import numpy as np
 import datetime as dt
 import time
 
 from pathlib import Path
+from copy import copy
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
-from .BaseBinaryReader import BinaryReader
+from .BaseBinaryReader import BinaryReader, Content, FileMaps
+from .BaseBinaryReader.Index import KeywordIndex
+from .SummaryCache import SummaryCache
 from HydrodynamicUtilities.Models.EclipseBinaryFile import (
     SUMMARYHeader,
     BinaryData,
+    LazyBinaryData,
     SUMMARY,
     INIT,
     UNRSTRSSPEC,
+    EGRID,
 )
 from HydrodynamicUtilities.Models.Time import TimeVector as Time
 
 
 class Convertor:
     @classmethod
-    def to_as_it_is(cls, data: RowBinaryData) -> Dict[str, Any]:
+    def to_as_it_is(
+        cls,
+        data: RowBinaryData,
+        threads: Optional[int] = None,
+        policy: Optional[DecodePolicy] = None,
+    ) -> Dict[str, Any]:
+        if threads is not None and threads > 1:
+            contents = list(data)
+            with ThreadPoolExecutor(threads) as executor:
+                decoded = executor.map(lambda content: content.decode(policy), contents)
+                return {c.keyword: v for c, v in zip(contents, decoded)}
+
         newdata = dict()
         for content in data:
             keyword = content.keyword
-            values = content.decode()
+            values = content.decode(policy)
             newdata[keyword] = values
         return newdata
 
@@ -46,8 +65,8 @@ class Convertor:
         year = start_date[2]
         hour = start_date[3]
         minute = start_date[4]
-        second = int(start_date[5])
-        return dt.datetime(year, month, day, hour, minute, second)
+        second, microsecond = divmod(int(start_date[5]), 10**6)
+        return dt.datetime(year, month, day, hour, minute, second, microsecond)
 
     @classmethod
     def get_datetime64(cls, start_date: np.ndarray) -> np.datetime64:
@@ -56,39 +75,179 @@ class Convertor:
         return np.datetime64(strftime)
 
     @classmethod
-    def to_binary_data(cls, data: RowBinaryData) -> BinaryData:
-        return BinaryData(Convertor.to_as_it_is(data))
+    def to_binary_data(
+        cls,
+        data: RowBinaryData,
+        threads: Optional[int] = None,
+        policy: Optional[DecodePolicy] = None,
+    ) -> BinaryData:
+        return BinaryData(Convertor.to_as_it_is(data, threads, policy), data.index)
 
+    @staticmethod
+    def load_keyword(
+        link: Path,
+        index: KeywordIndex,
+        use_mmap: bool,
+        policy: Optional[DecodePolicy],
+        keyword: str,
+        occurrence: Optional[int] = None,
+        maps: Optional[FileMaps] = None,
+    ) -> Any:
+        buffer = maps.get(link) if maps is not None else None
+        content = BinaryReader.read_keyword(
+            link, index, keyword, use_mmap, occurrence, buffer
+        )
+        return content.decode(policy)
 
-def to_summary(calc_name: str, smspec: RowBinaryData, unsmry: RowBinaryData) -> SUMMARY:
-    smspec_dict = Convertor.to_as_it_is(smspec)
-    unsmry_dict = Convertor.to_as_it_is(unsmry)
+    @classmethod
+    def to_lazy_binary_data(
+        cls,
+        link: Path,
+        index: KeywordIndex,
+        use_mmap: bool = False,
+        policy: Optional[DecodePolicy] = None,
+    ) -> LazyBinaryData:
+        maps = FileMaps() if use_mmap else None
+        loader = partial(cls.load_keyword, link, index, use_mmap, policy, maps=maps)
+        return LazyBinaryData(index, loader)
 
-    if "NAMES" in smspec_dict.keys():
-        value = smspec_dict.pop("NAMES")
-        smspec_dict["WGNAMES"] = value
+    @staticmethod
+    def load_split_keyword(
+        links: List[Path],
+        offsets: Union[np.ndarray, List[int]],
+        index: KeywordIndex,
+        use_mmap: bool,
+        policy: Optional[DecodePolicy],
+        keyword: str,
+        occurrence: Optional[int] = None,
+        maps: Optional[FileMaps] = None,
+    ) -> Any:
+        if occurrence is None:
+            headers = index[keyword]
+        else:
+            headers = [index[keyword][occurrence]]
+        if len(headers) == 0:
+            raise KeyError(keyword)
+
+        if use_mmap and maps is None:
+            maps = FileMaps()
+        if maps is not None:
+            targets = BinaryReader.area_targets(headers)
+        else:
+            targets = [None] * len(headers)
+
+        areas = []
+        for header, out in zip(headers, targets):
+            file_id = int(np.searchsorted(offsets, header.position, side="right")) - 1
+            link = links[file_id]
+            local = copy(header)
+            local.position -= int(offsets[file_id])
+            buffer = maps.get(link) if maps is not None else None
+            areas.append(BinaryReader.read_headers(link, [local], buffer, [out])[0])
+
+        content = Content(headers[0], areas[0])
+        for area in areas[1:]:
+            content.append(area)
+        return content.decode(policy)
 
+    @classmethod
+    def to_lazy_split_binary_data(
+        cls,
+        links: List[Path],
+        use_mmap: bool = False,
+        threads: Optional[int] = None,
+        policy: Optional[DecodePolicy] = None,
+    ) -> LazyBinaryData:
+        sizes = [os.path.getsize(link) for link in links]
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int64)
+
+        index = KeywordIndex()
+        for offset, file_index in zip(
+            offsets, BinaryReader.index_files(links, threads)
+        ):
+            for header in file_index:
+                shifted = copy(header)
+                shifted.position += int(offset)
+                index.append(shifted)
+
+        maps = FileMaps() if use_mmap else None
+        loader = partial(
+            cls.load_split_keyword, links, offsets, index, use_mmap, policy, maps=maps
+        )
+        return LazyBinaryData(index, loader)
+
+
+def to_summary_header(smspec_dict: Dict[str, Any]) -> SUMMARYHeader:
     if "NAMES" in smspec_dict.keys():
         value = smspec_dict.pop("NAMES")
         smspec_dict["WGNAMES"] = value
 
-    summary_header = SUMMARYHeader(
-        np.array(smspec_dict["KEYWORDS"]),
-        np.array(smspec_dict["WGNAMES"]),
-        np.array(smspec_dict["NUMS"]),
-        np.array(smspec_dict["UNITS"]),
+    return SUMMARYHeader(
+        np.asarray(smspec_dict["KEYWORDS"]),
+        np.asarray(smspec_dict["WGNAMES"]),
+        np.asarray(smspec_dict["NUMS"]),
+        np.asarray(smspec_dict["UNITS"]),
     )
 
+
+def to_summary(
+    calc_name: str,
+    smspec: RowBinaryData,
+    unsmry: RowBinaryData,
+    policy: Optional[DecodePolicy] = None,
+) -> SUMMARY:
+    smspec_dict = Convertor.to_as_it_is(smspec)
+    unsmry_dict = Convertor.to_as_it_is(unsmry, policy=policy)
+
     summary = SUMMARY(
         calc_name,
         unsmry_dict["PARAMS"],
         get_time_vector(smspec_dict, unsmry_dict),
-        summary_header,
+        to_summary_header(smspec_dict),
     )
 
     return summary
 
 
+def to_selected_summary(
+    calc_name: str,
+    smspec: RowBinaryData,
+    unsmry_links: List[Path],
+    use_mmap: bool = False,
+    keywords: Optional[Union[Iterable[str], str]] = None,
+    names: Optional[Union[Iterable[str], str]] = None,
+    num: Optional[Union[Iterable[str], str]] = None,
+    policy: Optional[DecodePolicy] = None,
+) -> SUMMARY:
+    smspec_dict = Convertor.to_as_it_is(smspec)
+    summary_header = to_summary_header(smspec_dict)
+    index = summary_header.index(keywords, names, num)
+    columns = np.concatenate([[0], index])
+
+    parts = []
+    for link, unsmry_index in zip(unsmry_links, BinaryReader.index_files(unsmry_links)):
+        if "PARAMS" in unsmry_index:
+            params_headers = unsmry_index["PARAMS"]
+            parts.append(
+                BinaryReader.read_columns(link, params_headers, columns, use_mmap)
+            )
+
+    if len(parts) == 0:
+        params = np.zeros((0, len(columns)))
+    elif len(parts) == 1:
+        params = parts[0]
+    else:
+        params = np.concatenate(parts)
+    params = Content.convert(params, policy)
+
+    return SUMMARY(
+        calc_name,
+        params[:, 1:],
+        to_time_vector(smspec_dict["STARTDAT"], params[:, 0]),
+        summary_header.new(index),
+    )
+
+
 def to_init(row_data: RowBinaryData, row_inspec: RowBinaryData) -> INIT:
     data = Convertor.to_as_it_is(row_data)
     inspec = Convertor.to_as_it_is(row_inspec)
@@ -101,15 +260,21 @@ def to_unrst_rsspec(
 ) -> UNRSTRSSPEC:
     unrst = Convertor.to_as_it_is(row_unrst)
     rsspec = Convertor.to_as_it_is(row_rsspec)
-    return UNRSTRSSPEC(BinaryData(unrst), BinaryData(rsspec))
+    return UNRSTRSSPEC(
+        BinaryData(unrst, row_unrst.index),
+        BinaryData(rsspec, row_rsspec.index),
+    )
 
 
 def get_time_vector(
     smspec: Dict[str, Any],
     unsmry: Dict[str, Any],
 ) -> Time:
-    datetime = Convertor.get_datetime64(smspec["STARTDAT"])
-    dey_vector: np.ndarray = unsmry["PARAMS"][:, 0]
+    return to_time_vector(smspec["STARTDAT"], unsmry["PARAMS"][:, 0])
+
+
+def to_time_vector(start_date: np.ndarray, dey_vector: np.ndarray) -> Time:
+    datetime = Convertor.get_datetime64(start_date)
     results = []
     for day_id, day in enumerate(dey_vector):
         day *= 3600 * 24 * 10**3
@@ -118,17 +283,45 @@ def get_time_vector(
     return Time(np.array(results))
 
 
-def read(link: Path, log: bool = True) -> Union[EclipseBinaryData]:
+def split_files(folder: Path, filename: str, letter: str) -> List[Path]:
+    pattern = re.compile(rf"{re.escape(filename)}\.{letter}(\d{{4}})")
+    links = []
+    for link in folder.iterdir():
+        match = pattern.fullmatch(link.name)
+        if match is not None:
+            links.append((int(match.group(1)), link))
+    return [link for number, link in sorted(links)]
+
+
+def is_split_extension(file_extension: str, letter: str) -> bool:
+    return re.fullmatch(rf"\.{letter}\d{{4}}", file_extension.upper()) is not None
+
+
+def read(
+    link: Path,
+    log: bool = True,
+    use_mmap: bool = False,
+    lazy: bool = False,
+    threads: Optional[int] = None,
+    policy: Optional[DecodePolicy] = None,
+) -> Union[EclipseBinaryData]:
     filename, file_extension = os.path.splitext(link.name)
     t = time.time()
-    if file_extension in (".SMSPEC", ".UNSMRY"):
-        results = read_summary(link)
+    results: EclipseBinaryData
+    if file_extension in (".SMSPEC", ".UNSMRY") or is_split_extension(
+        file_extension, "S"
+    ):
+        results = read_summary(link, use_mmap, policy=policy)
     elif file_extension in (".INIT", ".INSPEC"):
-        results = read_init(link)
-    elif file_extension in (".UNRST", ".RSSPEC"):
-        results = read_unrst_rsspec(link)
+        results = read_init(link, use_mmap, lazy, threads, policy)
+    elif file_extension in (".UNRST", ".RSSPEC") or is_split_extension(
+        file_extension, "X"
+    ):
+        results = read_unrst_rsspec(link, use_mmap, lazy, threads, policy)
+    elif file_extension == ".EGRID":
+        results = read_egrid(link, use_mmap, policy)
     else:
-        results = read_binary(link)
+        results = read_binary(link, use_mmap, lazy, threads, policy)
 
     if log:
         print(f"File {link} read in {round(time.time() - t, 2)} seconds")
@@ -136,54 +329,190 @@ def read(link: Path, log: bool = True) -> Union[EclipseBinaryData]:
     return results
 
 
-def read_summary(link: Path) -> SUMMARY:
+def read_summary(
+    link: Path,
+    use_mmap: bool = False,
+    keywords: Optional[Union[Iterable[str], str]] = None,
+    names: Optional[Union[Iterable[str], str]] = None,
+    num: Optional[Union[Iterable[str], str]] = None,
+    cache: bool = False,
+    policy: Optional[DecodePolicy] = None,
+) -> SUMMARY:
     folder = link.parent
     filename, file_extension = os.path.splitext(link.name)
 
     if file_extension.upper() == ".SMSPEC":
-        smspec = BinaryReader.read_all_file(folder / (filename + file_extension))
-        unsmry = BinaryReader.read_all_file(folder / (filename + ".UNSMRY"))
+        smspec_link = folder / (filename + file_extension)
+        unsmry_link = folder / (filename + ".UNSMRY")
     elif file_extension.upper() == ".UNSMRY":
-        smspec = BinaryReader.read_all_file(folder / (filename + ".SMSPEC"))
-        unsmry = BinaryReader.read_all_file(folder / (filename + file_extension))
+        smspec_link = folder / (filename + ".SMSPEC")
+        unsmry_link = folder / (filename + file_extension)
+    elif is_split_extension(file_extension, "S"):
+        smspec_link = folder / (filename + ".SMSPEC")
+        unsmry_link = folder / (filename + ".UNSMRY")
     else:
-        raise ValueError(f"File extension can only be '.UNSMRY', '.SMSPEC'")
+        raise ValueError(f"File extension can only be '.UNSMRY', '.SMSPEC', '.Snnnn'")
+
+    unsmry_links = [unsmry_link]
+    if not os.path.isfile(unsmry_link):
+        unsmry_links = split_files(folder, filename, "S") or unsmry_links
 
-    return to_summary(filename, smspec, unsmry)
+    if cache:
+        summary = read_cached_summary(smspec_link, unsmry_links, use_mmap)
+        summary.Values = Content.convert(summary.Values, policy)
+        if keywords is None and names is None and num is None:
+            return summary
+        else:
+            return summary.get(keywords, names, num)
 
+    smspec = BinaryReader.read_all_file(smspec_link, use_mmap)
 
-def read_init(link: Path) -> INIT:
+    if keywords is None and names is None and num is None:
+        unsmry = read_unsmry(unsmry_links, use_mmap)
+        return to_summary(filename, smspec, unsmry, policy)
+    else:
+        return to_selected_summary(
+            filename,
+            smspec,
+            unsmry_links,
+            use_mmap,
+            keywords,
+            names,
+            num,
+            policy,
+        )
+
+
+def read_unsmry(unsmry_links: List[Path], use_mmap: bool = False) -> RowBinaryData:
+    if len(unsmry_links) == 1:
+        return BinaryReader.read_all_file(unsmry_links[0], use_mmap)
+    else:
+        return BinaryReader.read_all_files(unsmry_links, use_mmap)
+
+
+def read_cached_summary(
+    smspec_link: Path,
+    unsmry_links: List[Path],
+    use_mmap: bool = False,
+) -> SUMMARY:
+    stamp = SummaryCache.stamp([smspec_link] + list(unsmry_links))
+    cache_link = SummaryCache.path(smspec_link)
+    summary = SummaryCache.load(cache_link, stamp)
+    if summary is not None:
+        return summary
+
+    filename, file_extension = os.path.splitext(smspec_link.name)
+    smspec = BinaryReader.read_all_file(smspec_link, use_mmap)
+    unsmry = read_unsmry(unsmry_links, use_mmap)
+    summary = to_summary(filename, smspec, unsmry)
+    try:
+        SummaryCache.save(cache_link, summary, stamp)
+    except OSError:
+        return summary
+
+    cached = SummaryCache.load(cache_link, stamp)
+    if cached is None:
+        return summary
+    return cached
+
+
+def read_init(
+    link: Path,
+    use_mmap: bool = False,
+    lazy: bool = False,
+    threads: Optional[int] = None,
+    policy: Optional[DecodePolicy] = None,
+) -> INIT:
     folder = link.parent
     filename, file_extension = os.path.splitext(link.name)
 
     if file_extension.upper() == ".INIT":
-        init = BinaryReader.read_all_file(folder / (filename + file_extension))
-        inspec = BinaryReader.read_all_file(folder / (filename + ".INSPEC"))
+        init = folder / (filename + file_extension)
+        inspec = folder / (filename + ".INSPEC")
     elif file_extension.upper() == ".INSPEC":
-        init = BinaryReader.read_all_file(folder / (filename + ".INIT"))
-        inspec = BinaryReader.read_all_file(folder / (filename + file_extension))
+        init = folder / (filename + ".INIT")
+        inspec = folder / (filename + file_extension)
     else:
         raise ValueError(f"File extension can only be '.INIT', '.INSPEC'")
 
-    return to_init(init, inspec)
+    return INIT(
+        read_binary(init, use_mmap, lazy, threads, policy),
+        read_binary(inspec, use_mmap, lazy),
+    )
 
 
-def read_unrst_rsspec(link: Path) -> UNRSTRSSPEC:
+def read_unrst_rsspec(
+    link: Path,
+    use_mmap: bool = False,
+    lazy: bool = False,
+    threads: Optional[int] = None,
+    policy: Optional[DecodePolicy] = None,
+) -> UNRSTRSSPEC:
     folder = link.parent
     filename, file_extension = os.path.splitext(link.name)
 
     if file_extension.upper() == ".UNRST":
-        unrst = BinaryReader.read_all_file(folder / (filename + file_extension))
-        rsspec = BinaryReader.read_all_file(folder / (filename + ".RSSPEC"))
+        unrst = folder / (filename + file_extension)
+        rsspec = folder / (filename + ".RSSPEC")
     elif file_extension.upper() == ".RSSPEC":
-        unrst = BinaryReader.read_all_file(folder / (filename + ".UNRST"))
-        rsspec = BinaryReader.read_all_file(folder / (filename + file_extension))
+        unrst = folder / (filename + ".UNRST")
+        rsspec = folder / (filename + file_extension)
+    elif is_split_extension(file_extension, "X"):
+        unrst = folder / (filename + ".UNRST")
+        rsspec = folder / (filename + ".RSSPEC")
     else:
-        raise ValueError(f"File extension can only be '.UNRST', '.RSSPEC'")
+        raise ValueError(f"File extension can only be '.UNRST', '.RSSPEC', '.Xnnnn'")
 
-    return to_unrst_rsspec(unrst, rsspec)
+    if os.path.isfile(rsspec):
+        rsspec_data = read_binary(rsspec, use_mmap, lazy)
+    else:
+        rsspec_data = None
 
+    unrst_links = split_files(folder, filename, "X")
+    if os.path.isfile(unrst) or len(unrst_links) == 0:
+        unrst_data = read_binary(unrst, use_mmap, lazy, threads, policy)
+    else:
+        unrst_data = read_split_binary(unrst_links, use_mmap, lazy, threads, policy)
+
+    return UNRSTRSSPEC(unrst_data, rsspec_data)
 
-def read_binary(link: Path) -> BinaryData:
-    rbd = BinaryReader().read_all_file(link)
-    return Convertor.to_binary_data(rbd)
+
+def read_egrid(
+    link: Path,
+    use_mmap: bool = False,
+    policy: Optional[DecodePolicy] = None,
+) -> EGRID:
+    filename, file_extension = os.path.splitext(link.name)
+    if file_extension.upper() != ".EGRID":
+        raise ValueError(f"File extension can only be '.EGRID'")
+
+    return EGRID(read_binary(link, use_mmap, lazy=True, policy=policy))
+
+
+def read_split_binary(
+    links: List[Path],
+    use_mmap: bool = False,
+    lazy: bool = False,
+    threads: Optional[int] = None,
+    policy: Optional[DecodePolicy] = None,
+) -> BinaryData:
+    if lazy:
+        return Convertor.to_lazy_split_binary_data(links, use_mmap, threads, policy)
+
+    rbd = BinaryReader.read_all_files(links, use_mmap, threads)
+    return Convertor.to_binary_data(rbd, threads, policy)
+
+
+def read_binary(
+    link: Path,
+    use_mmap: bool = False,
+    lazy: bool = False,
+    threads: Optional[int] = None,
+    policy: Optional[DecodePolicy] = None,
+) -> BinaryData:
+    if lazy:
+        index = BinaryReader.index_file(link)
+        return Convertor.to_lazy_binary_data(link, index, use_mmap, policy)
+
+    rbd = BinaryReader().read_all_file(link, use_mmap, threads)
+    return Convertor.to_binary_data(rbd, threads, policy)
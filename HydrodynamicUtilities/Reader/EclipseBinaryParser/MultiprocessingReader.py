@@ -4,47 +4,165 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    pass
+    from typing import Union, Iterable, Optional, Tuple, List
 
+    ReadResult = Tuple[int, Path, Union[SUMMARY, "MappedSUMMARY", None], Optional[str]]
+
+
+import os
+import time
+import shutil
+import weakref
+import tempfile
+import numpy as np
 
 from pathlib import Path
+from functools import partial
 from multiprocessing import Pool
+from numpy.lib.format import open_memmap
 
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY
 from HydrodynamicUtilities.Models.EclipseBinaryFile.Summary import SUMMARYList
 from ..SecondaryFunctions import research_folder
-from .BinaryFile import read
+from .BinaryFile import read_summary
 
 
 def research_read(
     folder: Path,
     multiprocessing: bool = False,
     log: bool = False,
+    max_workers: Optional[int] = None,
+    keywords: Optional[Union[Iterable[str], str]] = None,
+    names: Optional[Union[Iterable[str], str]] = None,
+    num: Optional[Union[Iterable[str], str]] = None,
+    transport: str = "pickle",
+    scratch: Optional[Path] = None,
 ) -> SUMMARYList:
+    if transport not in ("pickle", "memmap"):
+        raise ValueError(f"transport can only be 'pickle', 'memmap'")
+
+    list_of_path = research_folder(folder, ".SMSPEC", log=log)
+
+    temp_scratch = None
+    if not multiprocessing or transport == "pickle":
+        scratch = None
+    elif scratch is None:
+        temp_scratch = Path(tempfile.mkdtemp(prefix="research_read_"))
+        scratch = temp_scratch
+
+    task = partial(
+        __read_task,
+        log=log,
+        keywords=keywords,
+        names=names,
+        num=num,
+        scratch=scratch,
+    )
+
+    answer: Iterable[ReadResult]
     if multiprocessing:
-        return __research_read_multiprocessing(folder, log)
+        answer = __research_read_multiprocessing(list_of_path, task, max_workers)
     else:
-        return __research_read_no_multiprocessing(folder, log)
-
+        answer = map(task, enumerate(list_of_path))
 
-def __research_read_multiprocessing(folder: Path, log: bool) -> SUMMARYList:
-    list_of_path = research_folder(folder, ".SMSPEC", log=log)
     results = SUMMARYList()
+    for position, path, summary, error in sorted(answer, key=lambda x: x[0]):
+        if isinstance(summary, MappedSUMMARY):
+            summary = summary.to_summary(remove_folder=temp_scratch is not None)
 
-    # if log:
-    #     list_of_path = list(zip(list_of_path, [log] * len(list_of_path)))
+        if error is None:
+            results.append(summary)
+        else:
+            results.Errors[path] = error
+            if log:
+                print(f"File {path} skip: {error}")
 
-    with Pool(len(list_of_path)) as p:
-        answer = list(p.map(read, list_of_path))
-        results.extend(answer)
+    if temp_scratch is not None:
+        shutil.rmtree(temp_scratch, ignore_errors=True)
 
     return results
 
 
-def __research_read_no_multiprocessing(folder: Path, log: bool) -> SUMMARYList:
-    list_of_path = research_folder(folder, ".SMSPEC", log=log)
-    results = SUMMARYList()
-
-    for path in list_of_path:
-        results.append(read(path, log))
-
-    return results
+class MappedSUMMARY:
+    def __init__(self, summary: SUMMARY, link: Path) -> None:
+        self.CalcName = summary.CalcName
+        self.TimeVector = summary.TimeVector
+        self.Header = summary.Header
+        self.Link = link
+
+        values = open_memmap(  # type: ignore[no-untyped-call]
+            link,
+            mode="w+",
+            dtype=summary.Values.dtype,
+            shape=summary.Values.shape,
+        )
+        values[:] = summary.Values
+        values.flush()
+        del values
+
+    def to_summary(self, remove_folder: bool = False) -> SUMMARY:
+        """
+        Values are a copy-on-write map of the worker file, nothing is copied.
+        The file is unlinked at once where the OS allows it, otherwise it is
+        removed (with its folder, if 'remove_folder') when the values are
+        released.
+        """
+        values = np.load(self.Link, mmap_mode="c")
+        try:
+            os.remove(self.Link)
+        except OSError:
+            folder = self.Link.parent if remove_folder else None
+            weakref.finalize(values, self.__release, self.Link, folder)
+        return SUMMARY(self.CalcName, values, self.TimeVector, self.Header)
+
+    @staticmethod
+    def __release(link: Path, folder: Optional[Path]) -> None:
+        try:
+            os.remove(link)
+            if folder is not None:
+                os.rmdir(folder)
+        except OSError:
+            pass
+
+
+def __read_task(
+    task: Tuple[int, Path],
+    log: bool,
+    keywords: Optional[Union[Iterable[str], str]] = None,
+    names: Optional[Union[Iterable[str], str]] = None,
+    num: Optional[Union[Iterable[str], str]] = None,
+    scratch: Optional[Path] = None,
+) -> ReadResult:
+    position, path = task
+    t = time.time()
+    result: Union[SUMMARY, MappedSUMMARY]
+    try:
+        result = read_summary(path, keywords=keywords, names=names, num=num)
+        if scratch is not None:
+            link = Path(scratch) / f"{position}_{result.CalcName}.npy"
+            result = MappedSUMMARY(result, link)
+    except Exception as error:
+        return position, path, None, f"{type(error).__name__}: {error}"
+
+    if log:
+        print(f"File {path} read in {round(time.time() - t, 2)} seconds")
+    return position, path, result, None
+
+
+def __research_read_multiprocessing(
+    list_of_path: Iterable[Path],
+    task: partial,
+    max_workers: Optional[int] = None,
+) -> List[ReadResult]:
+    list_of_path = list(list_of_path)
+    if len(list_of_path) == 0:
+        return []
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = max(1, min(max_workers, len(list_of_path)))
+    chunksize = max(1, len(list_of_path) // (4 * workers))
+
+    with Pool(workers) as p:
+        answer = p.imap_unordered(task, enumerate(list_of_path), chunksize)
+        return list(answer)
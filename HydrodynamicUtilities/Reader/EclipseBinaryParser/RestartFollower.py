@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, List
+
+import os
+import struct
+
+from pathlib import Path
+from copy import copy
+from functools import partial
+
+from .BaseBinaryReader import BinaryReader, FileMaps
+from .BaseBinaryReader.Header import HeaderConstructor, BinaryHeaderWorker
+from .BaseBinaryReader.Index import KeywordIndex
+from .BaseBinaryReader.Content import DecodePolicy
+from .BinaryFile import Convertor, read_binary, split_files
+from HydrodynamicUtilities.Models.EclipseBinaryFile import (
+    LazyBinaryData,
+    UNRSTRSSPEC,
+)
+
+
+class RestartFollower:
+    """
+    Lazy restart data over the Xnnnn files of a running case. 'refresh()'
+    indexes the files written since the last call; a file is taken only
+    when its last record is complete.
+    """
+
+    def __init__(
+        self,
+        link: Path,
+        use_mmap: bool = False,
+        policy: Optional[DecodePolicy] = None,
+    ) -> None:
+        folder = link.parent
+        filename, file_extension = os.path.splitext(link.name)
+        self.CalcName = filename
+        self.Folder = folder
+        self.UseMmap = use_mmap
+        self.Policy = policy
+        self.RSSPEC = folder / (filename + ".RSSPEC")
+
+        self.Links: List[Path] = list()
+        self.Offsets: List[int] = list()
+        self.Sizes: List[int] = list()
+        self.Restart: Optional[UNRSTRSSPEC] = None
+        self.__index = KeywordIndex()
+        self.__unrst: Optional[LazyBinaryData] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {self.CalcName} {len(self.Links)}"
+
+    def __start(self) -> UNRSTRSSPEC:
+        self.Links = list()
+        self.Offsets = list()
+        self.Sizes = list()
+        self.__index = KeywordIndex()
+        loader = partial(
+            Convertor.load_split_keyword,
+            self.Links,
+            self.Offsets,
+            self.__index,
+            self.UseMmap,
+            self.Policy,
+            maps=FileMaps() if self.UseMmap else None,
+        )
+        self.__unrst = LazyBinaryData(self.__index, loader)
+
+        if os.path.isfile(self.RSSPEC):
+            rsspec = read_binary(self.RSSPEC, self.UseMmap, lazy=True)
+        else:
+            rsspec = None
+
+        self.Restart = UNRSTRSSPEC(self.__unrst, rsspec)
+        return self.Restart
+
+    @staticmethod
+    def __index_complete(link: Path) -> Optional[KeywordIndex]:
+        file_size = os.path.getsize(link)
+        index = KeywordIndex()
+        with open(link, "rb") as file:
+            while file.tell() < file_size:
+                if file.tell() + BinaryHeaderWorker.length_header > file_size:
+                    return None
+                try:
+                    header = HeaderConstructor.create("binary file", file=file)
+                    header.position = file.tell()
+                    header.length_area = BinaryReader.skip_area(file, header)
+                except (struct.error, NameError, UnicodeDecodeError):
+                    return None
+                if file.tell() > file_size:
+                    return None
+                index.append(header)
+
+        if len(index) == 0:
+            return None
+        return index
+
+    def __is_changed(self, links: List[Path]) -> bool:
+        if links[: len(self.Links)] != self.Links:
+            return True
+        for link, size in zip(self.Links, self.Sizes):
+            if os.path.getsize(link) != size:
+                return True
+        return False
+
+    def refresh(self) -> UNRSTRSSPEC:
+        restart = self.Restart
+        links = split_files(self.Folder, self.CalcName, "X")
+        if restart is None or self.__is_changed(links):
+            restart = self.__start()
+
+        known = len(self.Links)
+        for link in links[known:]:
+            file_index = self.__index_complete(link)
+            if file_index is None:
+                break
+
+            offset = self.Offsets[-1] + self.Sizes[-1] if self.Links else 0
+            for header in file_index:
+                shifted = copy(header)
+                shifted.position += offset
+                self.__index.append(shifted)
+
+            self.Links.append(link)
+            self.Offsets.append(offset)
+            self.Sizes.append(os.path.getsize(link))
+
+        if self.__unrst is not None and len(self.Links) > known:
+            self.__unrst.clear()
+        return restart
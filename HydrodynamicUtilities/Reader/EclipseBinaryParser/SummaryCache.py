@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Dict, Any, List
+
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+
+from pathlib import Path
+from numpy.lib.format import open_memmap
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY, SUMMARYHeader
+from HydrodynamicUtilities.Models.Time import TimeVector as Time
+
+
+class SummaryCache:
+    """
+    Column-major copy of SMSPEC/UNSMRY (CASE.summary or a hashed name in
+    'folder'), valid while size and modification time of both files match.
+    """
+
+    folder: Optional[Path] = None
+    suffix: str = ".summary"
+    version: int = 1
+    columns_per_step: int = 1000
+
+    @classmethod
+    def path(cls, link: Path) -> Path:
+        filename, file_extension = os.path.splitext(link.name)
+        if cls.folder is None:
+            return link.parent / (filename + cls.suffix)
+        else:
+            full_path = str(Path(link).resolve()).encode("utf-8")
+            key = hashlib.sha1(full_path).hexdigest()[:16]
+            return Path(cls.folder) / f"{filename}.{key}{cls.suffix}"
+
+    @classmethod
+    def stamp(cls, links: List[Path]) -> Dict[str, Any]:
+        files = []
+        for link in links:
+            stat = os.stat(link)
+            files.append([Path(link).name, stat.st_size, stat.st_mtime_ns])
+        return {"version": cls.version, "files": files}
+
+    @classmethod
+    def save(
+        cls,
+        folder: Path,
+        summary: SUMMARY,
+        stamp: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        temp = folder.parent / (folder.name + ".tmp")
+        shutil.rmtree(temp, ignore_errors=True)
+        temp.mkdir(parents=True)
+
+        values = summary.Values
+        dtype = values.dtype.newbyteorder("=")
+        matrix = open_memmap(  # type: ignore[no-untyped-call]
+            temp / "values.npy",
+            mode="w+",
+            dtype=dtype,
+            shape=values.shape,
+            fortran_order=True,
+        )
+        for start in range(0, values.shape[1], cls.columns_per_step):
+            stop = start + cls.columns_per_step
+            matrix[:, start:stop] = values[:, start:stop]
+        matrix.flush()
+        del matrix
+
+        header = summary.Header
+        np.savez(
+            temp / "header.npz",
+            keywords=header.Keywords.astype(str),
+            names=header.Names.astype(str),
+            num=header.Num.astype(str),
+            unit=header.Unit.astype(str),
+        )
+        np.save(temp / "time.npy", summary.TimeVector.to_datetime64())
+
+        with open(temp / "meta.json", "w") as file:
+            json.dump({"calc_name": summary.CalcName, "stamp": stamp}, file)
+
+        shutil.rmtree(folder, ignore_errors=True)
+        os.replace(temp, folder)
+
+    @classmethod
+    def load(
+        cls,
+        folder: Path,
+        stamp: Optional[Dict[str, Any]] = None,
+    ) -> Optional[SUMMARY]:
+        try:
+            with open(folder / "meta.json", "r") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if stamp is not None and meta.get("stamp") != stamp:
+            return None
+
+        try:
+            values = np.load(folder / "values.npy", mmap_mode="c")
+            with np.load(folder / "header.npz") as header:
+                summary_header = SUMMARYHeader(
+                    header["keywords"],
+                    header["names"],
+                    header["num"],
+                    header["unit"],
+                )
+            time_vector = Time(np.load(folder / "time.npy"))
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return SUMMARY(meta["calc_name"], values, time_vector, summary_header)
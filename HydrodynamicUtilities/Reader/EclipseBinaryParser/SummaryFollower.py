@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, List
+
+import os
+import struct
+import numpy as np
+
+from pathlib import Path
+
+from .BaseBinaryReader import BinaryReader
+from .BaseBinaryReader.Header import HeaderConstructor, BinaryHeaderWorker
+from .BaseBinaryReader.Content import Content, DecodePolicy
+from .BinaryFile import Convertor, to_summary_header, to_time_vector, split_files
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY
+from HydrodynamicUtilities.Models.Time import TimeVector as Time
+
+
+class SummaryFollower:
+    def __init__(self, link: Path, policy: Optional[DecodePolicy] = None) -> None:
+        folder = link.parent
+        filename, file_extension = os.path.splitext(link.name)
+        self.CalcName = filename
+        self.Folder = folder
+        self.Policy = policy
+        self.SMSPEC = folder / (filename + ".SMSPEC")
+        self.UNSMRY = folder / (filename + ".UNSMRY")
+
+        self.Position = 0
+        self.FileNumber = 0
+        self.Summary: Optional[SUMMARY] = None
+        self.__start_date = np.zeros(6, dtype=np.int32)
+        self.__values = np.zeros((0, 0), dtype=">f4")
+        self.__dates = np.zeros(0, dtype="datetime64[ms]")
+        self.__rows = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {self.UNSMRY} {self.__rows}"
+
+    def __start(self) -> SUMMARY:
+        smspec = BinaryReader.read_all_file(self.SMSPEC)
+        smspec_dict = Convertor.to_as_it_is(smspec)
+        header = to_summary_header(smspec_dict)
+
+        self.__start_date = smspec_dict["STARTDAT"]
+        self.__values = np.zeros((0, len(header.Keywords)), dtype=">f4")
+        self.__dates = np.zeros(0, dtype="datetime64[ms]")
+        self.__rows = 0
+        self.Position = 0
+        self.FileNumber = 0
+        self.Summary = SUMMARY(
+            self.CalcName,
+            self.__values,
+            Time(self.__dates),
+            header,
+        )
+        return self.Summary
+
+    def __read_tail(self, link: Path) -> List[np.ndarray]:
+        file_size = os.path.getsize(link)
+        rows = []
+        with open(link, "rb") as file:
+            file.seek(self.Position)
+            while file.tell() + BinaryHeaderWorker.length_header <= file_size:
+                header = HeaderConstructor.create("binary file", file=file)
+                header.position = file.tell()
+                if header.position + header.expected_length_area > file_size:
+                    break
+
+                try:
+                    if header.keyword == "PARAMS":
+                        area = BinaryReader.read_area(file, header)
+                    else:
+                        area = None
+                        BinaryReader.skip_area(file, header)
+                except struct.error:
+                    break
+
+                if file.tell() > file_size:
+                    break
+                if area is not None:
+                    if len(area) < header.length_block:
+                        break
+                    rows.append(Content(header, area).decode(self.Policy))
+
+                self.Position = file.tell()
+        return rows
+
+    def __extend(self, summary: SUMMARY, rows: List[np.ndarray]) -> None:
+        new_values = np.array(rows, dtype=rows[0].dtype)
+        new_dates = to_time_vector(self.__start_date, new_values[:, 0]).Dates
+        size = self.__rows + len(rows)
+
+        if self.__values.dtype != new_values.dtype:
+            self.__values = self.__values.astype(new_values.dtype)
+
+        if size > len(self.__values):
+            capacity = max(size, 2 * len(self.__values))
+            values = np.zeros((capacity, new_values.shape[1]), new_values.dtype)
+            values[: self.__rows] = self.__values[: self.__rows]
+            dates = np.zeros(capacity, dtype="datetime64[ms]")
+            dates[: self.__rows] = self.__dates[: self.__rows]
+            self.__values = values
+            self.__dates = dates
+
+        self.__values[self.__rows : size] = new_values
+        self.__dates[self.__rows : size] = new_dates
+        self.__rows = size
+
+        summary.Values = self.__values[:size]
+        summary.TimeVector.Dates = self.__dates[:size]
+
+    def refresh(self) -> SUMMARY:
+        summary = self.Summary
+        if summary is None:
+            summary = self.__start()
+
+        if os.path.isfile(self.UNSMRY):
+            links = [self.UNSMRY]
+        else:
+            links = split_files(self.Folder, self.CalcName, "S")
+
+        if len(links) == 0:
+            return summary
+
+        if len(links) <= self.FileNumber:
+            summary = self.__start()
+        elif os.path.getsize(links[self.FileNumber]) < self.Position:
+            summary = self.__start()
+
+        rows = []
+        while True:
+            rows += self.__read_tail(links[self.FileNumber])
+            if self.FileNumber + 1 >= len(links):
+                break
+            self.FileNumber += 1
+            self.Position = 0
+
+        if len(rows) > 0:
+            self.__extend(summary, rows)
+        return summary
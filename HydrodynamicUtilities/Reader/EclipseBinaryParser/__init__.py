@@ -1,3 +1,8 @@
 from .BaseBinaryReader.BinaryReader import RowBinaryData, BinaryReader
-from .BinaryFile import read_binary, read_summary, read
+from .BaseBinaryReader.IndexCache import IndexCache
+from .BaseBinaryReader.Content import DecodePolicy
+from .BinaryFile import read_binary, read_summary, read_egrid, read
+from .SummaryCache import SummaryCache
+from .SummaryFollower import SummaryFollower
+from .RestartFollower import RestartFollower
 from .MultiprocessingReader import research_read
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Optional, Iterable, Tuple, Union, Dict, BinaryIO
+
+import numpy as np
+
+from pathlib import Path
+from struct import pack
+
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader import (
+    BinaryReader,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader.Header import (
+    Header,
+    BinaryHeaderWorker,
+    BinaryHeaderReader,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader.Content import (
+    Content,
+)
+
+
+class BinaryHeaderWriter(BinaryHeaderWorker):
+    @classmethod
+    def get_format(cls, values: np.ndarray) -> str:
+        kind = values.dtype.kind
+        if kind == "b":
+            return "LOGI"
+        elif kind in "iu":
+            return "INTE"
+        elif kind == "f" and values.dtype.itemsize == 4:
+            return "REAL"
+        elif kind == "f":
+            return "DOUB"
+        elif kind in "US":
+            length = max(values.dtype.itemsize // (4 if kind == "U" else 1), 1)
+            if values.size > 0:
+                length = int(np.char.str_len(values).max())
+            if length <= cls.lengths["CHAR"]:
+                return "CHAR"
+            if length > 99:
+                raise ValueError(f"Strings of {length} characters can not be written")
+            return f"C0{length:02d}"
+        else:
+            raise TypeError(f"Values of type {values.dtype} can not be written")
+
+    @classmethod
+    def create(
+        cls,
+        keyword: str,
+        values: np.ndarray,
+        ecl_format: Optional[str] = None,
+    ) -> Header:
+        if ecl_format is None:
+            ecl_format = cls.get_format(values)
+        return BinaryHeaderReader.create(keyword, values.size, ecl_format)
+
+    @classmethod
+    def to_bytes(cls, header: Header) -> bytes:
+        size = cls.significant_byte
+        keyword = header.keyword.ljust(8).encode("utf-8")
+        ecl_format = header.EclipseFormat.encode("utf-8")
+        return pack(">i8si4si", size, keyword, header.number_obj, ecl_format, size)
+
+
+class BinaryWriter:
+    """
+    Streams keywords to an Eclipse binary file record by record; each
+    record is split into 1000 (105 for strings) item blocks with markers.
+    """
+
+    determinant: int = BinaryHeaderWorker.determinant
+    blocks_per_write: int = 1024
+    logical_true: int = -1
+
+    def __init__(self, link: Path) -> None:
+        self.Link = link
+        self.__file: Optional[BinaryIO] = open(link, "wb")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__} {self.Link}"
+
+    def __enter__(self) -> BinaryWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    @classmethod
+    def encode(cls, values: Any, header: Header) -> np.ndarray:
+        values = np.ravel(np.asarray(values))
+        if header.ConvertorFormat == "c":
+            if values.dtype.kind != "S":
+                values = np.char.encode(values.astype(str), "utf-8")
+            length = header.length_one_obj
+            if values.size > 0 and int(np.char.str_len(values).max()) > length:
+                raise ValueError(f"{header.keyword} has strings longer than {length}")
+            values = np.char.ljust(values, length)
+            data = values.astype(f"S{length}")
+        elif header.ConvertorFormat == "?":
+            data = np.where(values.astype(bool), cls.logical_true, 0).astype(">i4")
+        else:
+            data = values.astype(">" + header.ConvertorFormat, copy=False)
+        return np.frombuffer(data.tobytes(), dtype=np.uint8)
+
+    def __get_file(self) -> BinaryIO:
+        if self.__file is None:
+            raise ValueError(f"{self.Link} is closed")
+        return self.__file
+
+    def write_header(self, header: Header) -> None:
+        self.__get_file().write(BinaryHeaderWriter.to_bytes(header))
+
+    def write_area(self, header: Header, area: Union[bytes, np.ndarray]) -> None:
+        file = self.__get_file()
+        area = np.frombuffer(area, dtype=np.uint8)
+        size_area = header.length_one_obj * header.number_per_area
+        number_full = len(area) // size_area
+        step = size_area + 2 * self.determinant
+        marker = np.frombuffer(pack(">i", size_area), dtype=np.uint8)
+
+        for start in range(0, number_full, self.blocks_per_write):
+            stop = min(start + self.blocks_per_write, number_full)
+            blocks = np.empty((stop - start, step), dtype=np.uint8)
+            blocks[:, : self.determinant] = marker
+            blocks[:, -self.determinant :] = marker
+            chunk = area[start * size_area : stop * size_area]
+            blocks[:, self.determinant : -self.determinant] = chunk.reshape(
+                stop - start, size_area
+            )
+            file.write(blocks.tobytes())
+
+        last = area[number_full * size_area :]
+        if len(last) > 0:
+            last_marker = pack(">i", len(last))
+            file.write(last_marker + last.tobytes() + last_marker)
+
+    def write(
+        self,
+        keyword: str,
+        values: Any,
+        ecl_format: Optional[str] = None,
+    ) -> Header:
+        values = np.ravel(np.asarray(values))
+        header = BinaryHeaderWriter.create(keyword, values, ecl_format)
+        self.write_header(header)
+
+        step = self.blocks_per_write * header.number_per_area
+        for start in range(0, len(values), step):
+            chunk = values[start : start + step]
+            self.write_area(header, self.encode(chunk, header))
+        return header
+
+    def write_content(self, content: Content) -> None:
+        header = content.header
+        for area in content.values:
+            area = np.frombuffer(area, dtype=np.uint8)
+            number = len(area) // header.length_one_obj
+            record = BinaryHeaderReader.create(
+                header.keyword, number, header.EclipseFormat
+            )
+            self.write_header(record)
+            self.write_area(record, area)
+
+    def write_records(
+        self,
+        records: Union[Dict[str, Any], Iterable[Tuple[str, Any]]],
+    ) -> None:
+        if isinstance(records, dict):
+            records = records.items()
+        for keyword, values in records:
+            self.write(keyword, values)
+
+    def copy_records(
+        self,
+        link: Path,
+        keywords: Optional[Iterable[str]] = None,
+    ) -> None:
+        if keywords is not None:
+            keywords = set(keywords)
+
+        index = BinaryReader.index_file(link)
+        with open(link, "rb") as file:
+            for header in index:
+                if keywords is not None and header.keyword not in keywords:
+                    continue
+                file.seek(header.position)
+                self.write_header(header)
+                self.write_area(header, BinaryReader.read_area(file, header))
+
+
+def write_binary(
+    link: Path,
+    records: Union[Dict[str, Any], Iterable[Tuple[str, Any]]],
+) -> None:
+    with BinaryWriter(link) as writer:
+        writer.write_records(records)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Optional, Iterable, Union, List, Tuple, Dict, Any
+
+import os
+import numpy as np
+
+from pathlib import Path
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY, SUMMARYHeader
+from HydrodynamicUtilities.Models.Time import TimeVector as Time
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader import (
+    BinaryReader,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BinaryFile import (
+    Convertor,
+    read_summary,
+    split_files,
+)
+from .BinaryWriter import BinaryWriter, BinaryHeaderWriter
+
+__day = np.timedelta64(1, "D")
+
+
+def __summary_links(link: Path) -> Tuple[Path, List[Path]]:
+    folder = link.parent
+    filename, file_extension = os.path.splitext(link.name)
+    smspec_link = folder / (filename + ".SMSPEC")
+    unsmry_link = folder / (filename + ".UNSMRY")
+    if os.path.isfile(unsmry_link):
+        return smspec_link, [unsmry_link]
+    else:
+        return smspec_link, split_files(folder, filename, "S")
+
+
+def read_report_id(unsmry_links: List[Path]) -> np.ndarray:
+    results = []
+    report_count = 0
+    for index in BinaryReader.index_files(unsmry_links):
+        if "PARAMS" not in index:
+            continue
+        params = np.array([header.position for header in index["PARAMS"]])
+        if "SEQHDR" in index:
+            seqhdr = np.array([header.position for header in index["SEQHDR"]])
+        else:
+            seqhdr = np.zeros(0, dtype=np.int64)
+        report_id = np.searchsorted(seqhdr, params) + report_count
+        results.append(report_id)
+        report_count += len(seqhdr)
+
+    if len(results) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.concatenate(results)
+
+
+def write_summary(
+    link: Path,
+    summary: SUMMARY,
+    start_date: Optional[np.datetime64] = None,
+    report_id: Optional[np.ndarray] = None,
+    dimens: Optional[np.ndarray] = None,
+) -> None:
+    folder = link.parent
+    filename, file_extension = os.path.splitext(link.name)
+
+    header = summary.Header
+    dates = summary.TimeVector.to_datetime64().astype("datetime64[ms]")
+    if start_date is None:
+        start_date = dates[0] if len(dates) > 0 else np.datetime64("1970-01-01")
+    start_date = np.datetime64(start_date, "ms")
+
+    pattern = header.Keywords != "TIME"
+    keywords = np.concatenate([["TIME"], header.Keywords[pattern]])
+    names = np.concatenate([[":+:+:+:+"], header.Names[pattern]])
+    nums = np.concatenate([[0], header.Num[pattern].astype(int)])
+    units = np.concatenate([["DAYS"], header.Unit[pattern]])
+
+    if dimens is None:
+        dimens = np.array([len(keywords), 0, 0, 0, 0, -1])
+    else:
+        dimens = np.array(dimens)
+        dimens[0] = len(keywords)
+
+    names_format = BinaryHeaderWriter.get_format(names)
+    names_keyword = "WGNAMES" if names_format == "CHAR" else "NAMES"
+
+    start = start_date.astype(object)
+    startdat = [start.day, start.month, start.year, start.hour, start.minute]
+    startdat.append(start.second * 10**6 + start.microsecond)
+
+    with BinaryWriter(folder / (filename + ".SMSPEC")) as writer:
+        writer.write("DIMENS", dimens, "INTE")
+        writer.write("KEYWORDS", keywords, "CHAR")
+        writer.write(names_keyword, names, names_format)
+        writer.write("NUMS", nums, "INTE")
+        writer.write("UNITS", units, "CHAR")
+        writer.write("STARTDAT", startdat, "INTE")
+
+    time = ((dates - start_date) / __day).astype(np.float32)
+    values = np.asarray(summary.Values)[:, pattern]
+    if report_id is None:
+        report_id = np.arange(len(dates))
+
+    with BinaryWriter(folder / (filename + ".UNSMRY")) as writer:
+        row = np.empty(len(keywords), dtype=">f4")
+        for step in range(len(dates)):
+            if step == 0 or report_id[step] != report_id[step - 1]:
+                writer.write("SEQHDR", [report_id[step]], "INTE")
+            writer.write("MINISTEP", [step], "INTE")
+            row[0] = time[step]
+            row[1:] = values[step]
+            writer.write("PARAMS", row, "REAL")
+
+
+def __column_keys(header: SUMMARYHeader) -> List[Tuple[str, str, str, int]]:
+    keys = []
+    count: Dict[Tuple[str, str, str], int] = dict()
+    for key in zip(header.Keywords, header.Names, header.Num.astype(str)):
+        count[key] = count.get(key, -1) + 1
+        keys.append(key + (count[key],))
+    return keys
+
+
+def __align(summary: SUMMARY, header: SUMMARYHeader) -> np.ndarray:
+    columns = {key: column for column, key in enumerate(__column_keys(summary.Header))}
+
+    values = np.full((summary.Values.shape[0], len(header.Keywords)), np.nan)
+    for column, key in enumerate(__column_keys(header)):
+        source = columns.get(key)
+        if source is not None:
+            values[:, column] = summary.Values[:, source]
+    return values
+
+
+def subset_summary(
+    link: Path,
+    out_link: Path,
+    keywords: Optional[Union[Iterable[str], str]] = None,
+    names: Optional[Union[Iterable[str], str]] = None,
+    num: Optional[Union[Iterable[str], str]] = None,
+    report_steps: bool = False,
+    restarts: Optional[Iterable[Path]] = None,
+    use_mmap: bool = False,
+) -> SUMMARY:
+    """
+    Writes a reduced SMSPEC/UNSMRY pair. Cases in 'restarts' are older runs
+    (oldest first) whose steps before the next case start are prepended.
+    """
+    cases = list(restarts or []) + [link]
+
+    parts = []
+    for case in cases:
+        smspec_link, unsmry_links = __summary_links(case)
+        summary = read_summary(smspec_link, use_mmap, keywords, names, num)
+        parts.append((summary, read_report_id(unsmry_links)))
+
+    first_smspec_link = __summary_links(cases[0])[0]
+    smspec = Convertor.to_as_it_is(BinaryReader.read_all_file(first_smspec_link))
+    start_date = Convertor.get_datetime64(smspec["STARTDAT"])
+    dimens = smspec.get("DIMENS")
+
+    final = parts[-1][0]
+    values, dates, report_id = [], [], []
+    report_count = 0
+    for part_id, (summary, part_report_id) in enumerate(parts):
+        part_dates = summary.TimeVector.to_datetime64().astype("datetime64[ms]")
+        rows = np.ones(len(part_dates), dtype=bool)
+        if part_id + 1 < len(parts):
+            next_dates = parts[part_id + 1][0].TimeVector.to_datetime64()
+            if len(next_dates) > 0:
+                rows = part_dates < next_dates[0]
+        if report_steps:
+            last = np.ones(len(part_report_id), dtype=bool)
+            last[:-1] = part_report_id[1:] != part_report_id[:-1]
+            rows = rows & last
+
+        if summary is final:
+            part_values = np.asarray(summary.Values)
+        else:
+            part_values = __align(summary, final.Header)
+
+        part_report_id = part_report_id[rows]
+        if len(part_report_id) > 0:
+            part_report_id = part_report_id - part_report_id[0] + report_count
+            report_count = part_report_id[-1] + 1
+
+        values.append(part_values[rows])
+        dates.append(part_dates[rows])
+        report_id.append(part_report_id)
+
+    filename, file_extension = os.path.splitext(Path(out_link).name)
+    results = SUMMARY(
+        filename,
+        np.concatenate(values).astype(np.float32),
+        Time(np.concatenate(dates)),
+        final.Header,
+    )
+    write_summary(
+        Path(out_link),
+        results,
+        start_date,
+        np.concatenate(report_id),
+        dimens,
+    )
+    return results
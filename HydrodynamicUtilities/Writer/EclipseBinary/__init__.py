@@ -0,0 +1,2 @@
+from .BinaryWriter import BinaryWriter, BinaryHeaderWriter, write_binary
+from .SummaryWriter import write_summary, subset_summary
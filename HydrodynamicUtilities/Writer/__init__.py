@@ -1,2 +1,3 @@
 from .Schedule import SCHWriter
 from .Schedule import get_pattern, write_xlsx
+from .EclipseBinary import BinaryWriter, write_binary, write_summary, subset_summary
@@ -0,0 +1,169 @@
+"""
+Synthetic Eclipse binary files for parser benchmarks: SMSPEC/UNSMRY,
+INIT/INSPEC and UNRST/RSSPEC in the record layout of the simulator.
+"""
+
+import argparse
+import numpy as np
+
+from pathlib import Path
+from typing import Tuple
+
+from HydrodynamicUtilities.Writer.EclipseBinary import BinaryWriter
+
+well_keywords = ("WOPR", "WWPR", "WGPR", "WBHP", "WOPT", "WWPT", "WGPT", "WWCT")
+segment_keywords = ("SOFR", "SWFR", "SPR")
+
+
+def summary_header(wells: int, segments: int) -> Tuple[list, list, list, list]:
+    keywords = ["TIME", "FOPR", "FOPT", "FWPR", "FWPT"]
+    names = [":+:+:+:+", "FIELD", "FIELD", "FIELD", "FIELD"]
+    nums = [0, 0, 0, 0, 0]
+    units = ["DAYS", "SM3/DAY", "SM3", "SM3/DAY", "SM3"]
+    for well in range(wells):
+        name = f"W{well + 1}"
+        for keyword in well_keywords:
+            keywords.append(keyword)
+            names.append(name)
+            nums.append(0)
+            units.append("SM3/DAY")
+        for segment in range(segments):
+            for keyword in segment_keywords:
+                keywords.append(keyword)
+                names.append(name)
+                nums.append(segment + 1)
+                units.append("SM3/DAY")
+    return keywords, names, nums, units
+
+
+def generate_summary(
+    folder: Path,
+    name: str = "CASE",
+    wells: int = 100,
+    segments: int = 5,
+    steps: int = 500,
+    ministeps: int = 2,
+    seed: int = 0,
+) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    keywords, names, nums, units = summary_header(wells, segments)
+
+    with BinaryWriter(folder / f"{name}.SMSPEC") as writer:
+        writer.write("DIMENS", [len(keywords), 10, 10, 10, 0, -1], "INTE")
+        writer.write("KEYWORDS", keywords, "CHAR")
+        writer.write("WGNAMES", names, "CHAR")
+        writer.write("NUMS", nums, "INTE")
+        writer.write("UNITS", units, "CHAR")
+        writer.write("STARTDAT", [1, 1, 2020, 0, 0, 0], "INTE")
+
+    rng = np.random.default_rng(seed)
+    with BinaryWriter(folder / f"{name}.UNSMRY") as writer:
+        ministep = 0
+        for step in range(steps):
+            writer.write("SEQHDR", [step], "INTE")
+            for _ in range(ministeps):
+                row = rng.random(len(keywords), dtype=np.float32)
+                row[0] = (ministep + 1) * 30.0 / ministeps
+                writer.write("MINISTEP", [ministep], "INTE")
+                writer.write("PARAMS", row, "REAL")
+                ministep += 1
+
+    return folder / f"{name}.SMSPEC"
+
+
+def generate_init(
+    folder: Path,
+    name: str = "CASE",
+    nx: int = 100,
+    ny: int = 100,
+    nz: int = 50,
+    properties: int = 6,
+) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    cells = nx * ny * nz
+    intehead = np.zeros(411, dtype=np.int32)
+    intehead[8:12] = nx, ny, nz, cells
+
+    names = ("PORV", "DX", "DY", "DZ", "PERMX", "PERMY", "PERMZ", "PORO")
+    keywords = ["INTEHEAD", "LOGIHEAD", "DOUBHEAD"] + list(names[:properties])
+    with BinaryWriter(folder / f"{name}.INIT") as writer:
+        writer.write("INTEHEAD", intehead, "INTE")
+        writer.write("LOGIHEAD", np.zeros(121, dtype=bool), "LOGI")
+        writer.write("DOUBHEAD", np.zeros(229), "DOUB")
+        for prop in names[:properties]:
+            writer.write(prop, np.linspace(0, 1, cells, dtype=np.float32), "REAL")
+        writer.write("TABDIMS", np.zeros(100, dtype=np.int32), "INTE")
+        writer.write("TAB", np.linspace(0, 1, 10000), "DOUB")
+
+    with BinaryWriter(folder / f"{name}.INSPEC") as writer:
+        writer.write("NAME", keywords, "CHAR")
+
+    return folder / f"{name}.INIT"
+
+
+def generate_unrst(
+    folder: Path,
+    name: str = "CASE",
+    cells: int = 100000,
+    steps: int = 20,
+) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    keywords = ("PRESSURE", "SWAT", "SGAS", "RS")
+
+    with BinaryWriter(folder / f"{name}.UNRST") as writer:
+        for step in range(steps):
+            intehead = np.zeros(411, dtype=np.int32)
+            intehead[64:67] = 1, 1 + step % 12, 2020 + step // 12
+            writer.write("SEQNUM", [step], "INTE")
+            writer.write("INTEHEAD", intehead, "INTE")
+            writer.write("LOGIHEAD", np.zeros(121, dtype=bool), "LOGI")
+            writer.write("DOUBHEAD", np.zeros(229), "DOUB")
+            for keyword in keywords:
+                values = np.full(cells, 100.0 + step, dtype=np.float32)
+                writer.write(keyword, values, "REAL")
+
+    with BinaryWriter(folder / f"{name}.RSSPEC") as writer:
+        writer.write("NAME", list(keywords), "CHAR")
+
+    return folder / f"{name}.UNRST"
+
+
+def generate_research(
+    folder: Path,
+    cases: int = 8,
+    wells: int = 50,
+    steps: int = 200,
+) -> Path:
+    for case in range(cases):
+        generate_summary(
+            folder / f"case_{case}",
+            f"CASE_{case}",
+            wells=wells,
+            steps=steps,
+            seed=case,
+        )
+    return folder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("folder", type=Path)
+    parser.add_argument("--wells", type=int, default=100)
+    parser.add_argument("--segments", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--cells", type=int, nargs=3, default=(100, 100, 50))
+    parser.add_argument("--restart-steps", type=int, default=20)
+    parser.add_argument("--cases", type=int, default=8)
+    args = parser.parse_args()
+
+    nx, ny, nz = args.cells
+    generate_summary(
+        args.folder, wells=args.wells, segments=args.segments, steps=args.steps
+    )
+    generate_init(args.folder, nx=nx, ny=ny, nz=nz)
+    generate_unrst(args.folder, cells=nx * ny * nz, steps=args.restart_steps)
+    generate_research(args.folder / "research", cases=args.cases)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Binary parser benchmarks on synthetic files. Every benchmark runs in a fresh
+process, so the peak RSS is its own. Times are compared with the baseline
+relative to a fixed calibration workload timed in the same process, and only
+when the baseline was recorded with the same interpreter and architecture.
+Usage:
+
+    python benchmarks/run.py --size small --baseline benchmarks/baseline.json
+    python benchmarks/run.py --size small --save benchmarks/baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import platform
+import multiprocessing as mp
+
+import numpy as np
+
+from pathlib import Path
+from typing import Callable, Dict, Any, Tuple, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate import (
+    generate_summary,
+    generate_init,
+    generate_unrst,
+    generate_research,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser import (
+    BinaryReader,
+    IndexCache,
+    read_summary,
+    read,
+    research_read,
+)
+
+try:
+    import resource
+
+    has_resource = True
+except ImportError:
+    has_resource = False
+
+sizes: Dict[str, Dict[str, Any]] = {
+    "small": {"wells": 200, "steps": 500, "cells": (100, 100, 20), "cases": 4},
+    "medium": {"wells": 500, "steps": 2000, "cells": (200, 200, 50), "cases": 8},
+    "large": {"wells": 2000, "steps": 5000, "cells": (400, 400, 100), "cases": 16},
+}
+
+
+def peak_rss_mb() -> Optional[float]:
+    if not has_resource:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak / 2**20
+    return peak / 2**10
+
+
+def machine_info() -> Dict[str, str]:
+    return {
+        "implementation": platform.python_implementation(),
+        "python": platform.python_version(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+    }
+
+
+def calibrate() -> None:
+    data = np.arange(2**21, dtype=">f4").tobytes()
+    values = np.frombuffer(data, dtype=">f4").astype(np.float64)
+    values.sum()
+    sum(range(2**18))
+
+
+def bench_read_all_file(link: Path) -> Callable[[], Tuple[int, int]]:
+    def task() -> Tuple[int, int]:
+        BinaryReader.read_all_file(link)
+        return os.path.getsize(link), 0
+
+    return task
+
+
+def bench_read_init(folder: Path) -> Callable[[], Tuple[int, int]]:
+    def task() -> Tuple[int, int]:
+        read(folder / "CASE.INIT", log=False)
+        return os.path.getsize(folder / "CASE.INIT"), 0
+
+    return task
+
+
+def bench_read_summary(
+    folder: Path,
+    keywords: Optional[str] = None,
+) -> Callable[[], Tuple[int, int]]:
+    def task() -> Tuple[int, int]:
+        if keywords is None:
+            summary = read_summary(folder / "CASE.SMSPEC")
+        else:
+            summary = read_summary(folder / "CASE.SMSPEC", keywords=keywords)
+        return os.path.getsize(folder / "CASE.UNSMRY"), summary.Values.shape[1]
+
+    return task
+
+
+def bench_summary_get(folder: Path) -> Callable[[], Tuple[int, int]]:
+    summary = read_summary(folder / "CASE.SMSPEC")
+
+    def task() -> Tuple[int, int]:
+        vectors = 0
+        for keyword in ("WOPR", "WWPR", "WBHP", "SOFR"):
+            for well in range(1, 11):
+                values = summary.get(keyword, f"W{well}").Values
+                values.sum()
+                vectors += values.shape[1]
+        return 0, vectors
+
+    return task
+
+
+def bench_research_read(
+    folder: Path,
+    multiprocessing: bool = False,
+) -> Callable[[], Tuple[int, int]]:
+    files = list((folder / "research").rglob("*.UNSMRY"))
+    size = sum(f.stat().st_size for f in files)
+
+    def task() -> Tuple[int, int]:
+        results = research_read(folder / "research", multiprocessing=multiprocessing)
+        return size, sum(summary.Values.shape[1] for summary in results)
+
+    return task
+
+
+benchmarks: Dict[str, Callable[[Path], Callable[[], Tuple[int, int]]]] = {
+    "read_all_file UNSMRY": lambda f: bench_read_all_file(f / "CASE.UNSMRY"),
+    "read_all_file INIT": lambda f: bench_read_all_file(f / "CASE.INIT"),
+    "read_all_file UNRST": lambda f: bench_read_all_file(f / "CASE.UNRST"),
+    "read INIT": bench_read_init,
+    "read_summary": bench_read_summary,
+    "read_summary selected": lambda f: bench_read_summary(f, "WOPR"),
+    "SUMMARY.get": bench_summary_get,
+    "research_read": bench_research_read,
+    "research_read multiprocessing": lambda f: bench_research_read(f, True),
+}
+
+
+def run_one(
+    name: str,
+    folder: Path,
+    repeat: int,
+    index_cache: bool,
+    queue: mp.Queue,
+) -> None:
+    IndexCache.enabled = index_cache
+    task = benchmarks[name](folder)
+    calibrate()
+    best, calibration = float("inf"), float("inf")
+    size, vectors = 0, 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size, vectors = task()
+        best = min(best, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        calibrate()
+        calibration = min(calibration, time.perf_counter() - start)
+
+    queue.put(
+        {
+            "seconds": best,
+            "relative": best / calibration,
+            "mb_s": size / 2**20 / best if size else None,
+            "vectors_s": vectors / best if vectors else None,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+    )
+
+
+def run(folder: Path, repeat: int, index_cache: bool) -> Dict[str, Dict[str, Any]]:
+    context = mp.get_context("spawn")
+    results = dict()
+    for name in benchmarks:
+        queue = context.Queue()
+        args = (name, folder, repeat, index_cache, queue)
+        process = context.Process(target=run_one, args=args)
+        process.start()
+        results[name] = queue.get()
+        process.join()
+    return results
+
+
+def generate(folder: Path, size: Dict[str, Any]) -> None:
+    nx, ny, nz = size["cells"]
+    generate_summary(folder, wells=size["wells"], steps=size["steps"])
+    generate_init(folder, nx=nx, ny=ny, nz=nz)
+    generate_unrst(folder, cells=nx * ny * nz)
+    generate_research(folder / "research", cases=size["cases"])
+
+
+def report(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Optional[Dict[str, Dict[str, Any]]] = None,
+    tolerance: float = 1.2,
+) -> bool:
+    def number(value: Optional[float], digits: int = 1) -> str:
+        return "-" if value is None else f"{value:.{digits}f}"
+
+    regression = False
+    print(f"{'benchmark':32}{'seconds':>10}{'MB/s':>10}{'vectors/s':>12}{'RSS MB':>10}")
+    for name, result in results.items():
+        line = (
+            f"{name:32}{number(result['seconds'], 4):>10}"
+            f"{number(result['mb_s']):>10}{number(result['vectors_s'], 0):>12}"
+            f"{number(result['peak_rss_mb']):>10}"
+        )
+        base_relative = (
+            None if baseline is None else baseline.get(name, {}).get("relative")
+        )
+        if base_relative:
+            ratio = float(result["relative"]) / float(base_relative)
+            line += f"  x{ratio:.2f}"
+            if ratio > tolerance:
+                line += " SLOWER"
+                regression = True
+        print(line)
+    return regression
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", choices=list(sizes), default="small")
+    parser.add_argument("--folder", type=Path, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--index-cache", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=1.2)
+    parser.add_argument("--save", type=Path, default=None)
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    folder = args.folder
+    temp_folder = None
+    if folder is None:
+        temp_folder = Path(tempfile.mkdtemp(prefix="hu_benchmarks_"))
+        folder = temp_folder
+    if not (folder / "CASE.SMSPEC").is_file():
+        generate(folder, sizes[args.size])
+
+    try:
+        results = run(folder, args.repeat, args.index_cache)
+    finally:
+        if temp_folder is not None:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, "r") as file:
+            stored = json.load(file)
+        if stored["size"] != args.size:
+            print(f"Baseline size is {stored['size']}, not {args.size}")
+        stored_info = stored.get("machine_info")
+        if stored_info != machine_info():
+            print(f"Baseline was recorded on {stored_info}, comparison skipped")
+        else:
+            baseline = stored["results"]
+
+    regression = report(results, baseline, args.tolerance)
+
+    if args.save is not None:
+        stored = {
+            "size": args.size,
+            "repeat": args.repeat,
+            "machine_info": machine_info(),
+            "results": results,
+        }
+        with open(args.save, "w") as file:
+            json.dump(stored, file, indent=2)
+
+    sys.exit(1 if regression else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+import pytest
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY, SUMMARYHeader
+from HydrodynamicUtilities.Models.Time import TimeVector as Time
+
+Column = Tuple[str, str, int, str]
+
+
+def build_header(columns: Sequence[Column]) -> SUMMARYHeader:
+    keywords, names, num, units = (np.array(values) for values in zip(*columns))
+    return SUMMARYHeader(keywords, names, num, units)
+
+
+def build_summary(
+    columns: Sequence[Column],
+    values: Optional[np.ndarray] = None,
+    steps: int = 3,
+    start: str = "2020-01-01",
+) -> SUMMARY:
+    """
+    Summary with one column per (keyword, name, num, unit) and daily steps.
+    Default values are 0, 1, 2... row by row.
+    """
+    if values is None:
+        values = np.arange(steps * len(columns), dtype=np.float32)
+        values = values.reshape(steps, len(columns))
+    days = np.arange(values.shape[0]) * np.timedelta64(1, "D")
+    dates = np.datetime64(start, "ms") + days
+    return SUMMARY("CASE", values, Time(dates), build_header(columns))
+
+
+@pytest.fixture
+def make_header() -> Callable[[Sequence[Column]], SUMMARYHeader]:
+    return build_header
+
+
+@pytest.fixture
+def make_summary() -> Callable[..., SUMMARY]:
+    return build_summary
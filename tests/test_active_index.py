@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile.ActiveIndex import ActiveIndex
+
+
+def test_cached_arrays_are_read_only() -> None:
+    ActiveIndex.clear()
+    active_index = ActiveIndex.get(2, 2, 2, np.array([1, 0, 1, 1, 1, 1, 0, 1]))
+    assert ActiveIndex.get(2, 2, 2, np.array([1, 0, 1, 1, 1, 1, 0, 1])) is active_index
+
+    i, j, k = active_index.global_ijk()
+    for values in (i, j, k, active_index.ActiveToGlobal, active_index.GlobalToActive):
+        with pytest.raises(ValueError):
+            values[0] = 0
+
+    i_active = active_index.active_ijk()[0]
+    i_active[0] = 0
+    assert list(active_index.global_ijk()[0]) == [1, 2, 1, 2, 1, 2, 1, 2]
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from pathlib import Path
+from typing import List, Optional
+
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader import (
+    BinaryReader,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BinaryFile import (
+    read_binary,
+    read_split_binary,
+)
+from HydrodynamicUtilities.Writer.EclipseBinary import BinaryWriter
+
+pressure = [np.linspace(step, step + 1, 2500, dtype=np.float32) for step in range(3)]
+
+
+def write_steps(link: Path) -> Path:
+    with BinaryWriter(link) as writer:
+        writer.write("INTEHEAD", np.arange(10, dtype=np.int32))
+        for step, values in enumerate(pressure):
+            writer.write("SEQNUM", np.array([step], dtype=np.int32))
+            writer.write("PRESSURE", values)
+    return link
+
+
+@pytest.mark.parametrize("threads", [None, 2])
+def test_mapped_records_are_stripped_into_one_buffer(
+    tmp_path: Path, threads: Optional[int]
+) -> None:
+    link = write_steps(tmp_path / "CASE.UNRST")
+    data = BinaryReader.read_all_file(link, use_mmap=True, threads=threads)
+
+    content = data["PRESSURE"]
+    joined = content.join()
+    assert not any(value.flags.owndata for value in content.values)
+    assert all(np.shares_memory(joined, value) for value in content.values)
+    assert np.array_equal(content.decode(), np.stack(pressure))
+
+    intehead = data["INTEHEAD"].values[0]
+    assert not intehead.flags.owndata
+    assert np.array_equal(data["INTEHEAD"].decode(), np.arange(10))
+    assert np.array_equal(data["SEQNUM"].decode().ravel(), [0, 1, 2])
+
+
+def test_lazy_keywords_map_each_file_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for number in range(3):
+        write_steps(tmp_path / f"CASE.X{number:04d}")
+    write_steps(tmp_path / "CASE.UNRST")
+
+    mapped: List[Path] = []
+    map_file = BinaryReader.map_file
+    monkeypatch.setattr(
+        BinaryReader,
+        "map_file",
+        staticmethod(lambda link: mapped.append(link) or map_file(link)),
+    )
+
+    unified = read_binary(tmp_path / "CASE.UNRST", use_mmap=True, lazy=True)
+    links = [tmp_path / f"CASE.X{number:04d}" for number in range(3)]
+    split = read_split_binary(links, use_mmap=True, lazy=True)
+    for data, files in ((unified, 1), (split, 3)):
+        mapped.clear()
+        for step in range(3):
+            assert np.array_equal(data.get("PRESSURE", step), pressure[step])
+        assert np.array_equal(data.SEQNUM.ravel(), [0, 1, 2] * files)
+        assert len(mapped) == len(set(mapped)) == files
@@ -0,0 +1,74 @@
+import filecmp
+import numpy as np
+import pytest
+
+from pathlib import Path
+
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader import (
+    BinaryReader,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BinaryFile import read_binary
+from HydrodynamicUtilities.Writer.EclipseBinary import BinaryWriter, write_binary
+
+records = {
+    "INTEHEAD": np.arange(2500, dtype=np.int32),
+    "PORO": np.linspace(0, 1, 2345, dtype=np.float32),
+    "DOUBHEAD": np.linspace(0, 1, 1001),
+    "LOGIHEAD": np.array([True, False, True]),
+    "NAMES": np.array([f"W{i}" for i in range(250)]),
+    "LONG": np.array(["ABCDEFGHIJKL", "M"]),
+    "EMPTY": np.zeros(0, dtype=np.int32),
+}
+
+
+def write_sample(link: Path) -> Path:
+    with BinaryWriter(link) as writer:
+        for keyword, values in records.items():
+            writer.write(keyword, values)
+        writer.write("PORO", records["PORO"][:10])
+    return link
+
+
+def test_raw_copy_is_identical(tmp_path: Path) -> None:
+    source = write_sample(tmp_path / "SOURCE.INIT")
+    BinaryWriter.blocks_per_write = 2
+    try:
+        with BinaryWriter(tmp_path / "COPY.INIT") as writer:
+            writer.copy_records(source)
+    finally:
+        BinaryWriter.blocks_per_write = 1024
+    assert filecmp.cmp(source, tmp_path / "COPY.INIT", shallow=False)
+
+
+def test_decoded_round_trip_is_identical(tmp_path: Path) -> None:
+    source = write_sample(tmp_path / "SOURCE.INIT")
+    with BinaryWriter(tmp_path / "DECODED.INIT") as writer:
+        for header, values in BinaryReader.iter_records(source):
+            writer.write(header.keyword, values, header.EclipseFormat)
+    assert filecmp.cmp(source, tmp_path / "DECODED.INIT", shallow=False)
+
+
+def test_values_are_read_back(tmp_path: Path) -> None:
+    write_binary(tmp_path / "VALUES.INIT", records)
+    data = read_binary(tmp_path / "VALUES.INIT")
+    for keyword, values in records.items():
+        assert np.array_equal(getattr(data, keyword), values), keyword
+
+    formats = {
+        h.keyword: h.EclipseFormat
+        for h in BinaryReader.index_file(tmp_path / "VALUES.INIT")
+    }
+    assert formats["LONG"] == "C012"
+    assert formats["LOGIHEAD"] == "LOGI"
+
+
+def test_too_long_string_type_is_rejected(tmp_path: Path) -> None:
+    with BinaryWriter(tmp_path / "LONG.INIT") as writer:
+        with pytest.raises(ValueError):
+            writer.write("LONG", np.array(["A" * 100]))
+
+
+def test_string_wider_than_item_is_rejected(tmp_path: Path) -> None:
+    with BinaryWriter(tmp_path / "WIDE.INIT") as writer:
+        with pytest.raises(ValueError):
+            writer.write("ZWEL", np.array(["PRODUCER_1"]), "CHAR")
@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+import pytest
+
+from pathlib import Path
+from typing import Callable
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY
+from HydrodynamicUtilities.Reader.EclipseBinaryParser import research_read
+from HydrodynamicUtilities.Writer.EclipseBinary import write_summary
+
+columns = [("WOPR", "W1", 0, "SM3/DAY"), ("WBHP", "W1", 0, "BARSA")]
+
+
+def write_cases(folder: Path, make_summary: Callable[..., SUMMARY]) -> None:
+    for case in range(3):
+        (folder / f"CASE{case}").mkdir(parents=True)
+        values = np.arange(6, dtype=np.float32).reshape(3, 2) + case
+        write_summary(
+            folder / f"CASE{case}" / "CASE.SMSPEC", make_summary(columns, values)
+        )
+
+
+def test_memmap_transport_keeps_mapped_values(
+    tmp_path: Path, make_summary: Callable[..., SUMMARY]
+) -> None:
+    write_cases(tmp_path / "research", make_summary)
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+
+    expected = research_read(tmp_path / "research")
+    results = research_read(
+        tmp_path / "research",
+        multiprocessing=True,
+        max_workers=2,
+        transport="memmap",
+        scratch=scratch,
+    )
+
+    assert len(results) == len(expected) == 3
+    for summary, reference in zip(results, expected):
+        assert isinstance(summary.Values, np.memmap)
+        assert np.array_equal(summary.Values, reference.Values)
+        summary.Values[0, 0] = -1
+    assert scratch.is_dir()
+    if os.name == "posix":
+        assert os.listdir(scratch) == []
+
+
+@pytest.mark.parametrize("multiprocessing", [False, True])
+def test_unknown_transport_is_rejected(tmp_path: Path, multiprocessing: bool) -> None:
+    with pytest.raises(ValueError):
+        research_read(tmp_path, multiprocessing=multiprocessing, transport="memap")
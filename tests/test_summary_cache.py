@@ -0,0 +1,28 @@
+import os
+
+import numpy as np
+
+from pathlib import Path
+from typing import Callable
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY
+from HydrodynamicUtilities.Reader.EclipseBinaryParser import read_summary
+from HydrodynamicUtilities.Writer.EclipseBinary import write_summary
+
+
+def test_broken_cache_is_rebuilt(
+    tmp_path: Path, make_summary: Callable[..., SUMMARY]
+) -> None:
+    columns = [("WOPR", "W1", 0, "SM3/DAY"), ("WBHP", "W1", 0, "BARSA")]
+    values = np.array([[1, 2], [3, 4], [5, 6]], dtype=np.float32)
+    write_summary(tmp_path / "CASE.SMSPEC", make_summary(columns, values))
+
+    first = read_summary(tmp_path / "CASE.SMSPEC", cache=True)
+    assert np.array_equal(first.Values[:, 1:], values)
+
+    del first
+    os.remove(tmp_path / "CASE.summary" / "values.npy")
+    second = read_summary(tmp_path / "CASE.SMSPEC", cache=True)
+    assert isinstance(second, SUMMARY)
+    assert np.array_equal(second.Values[:, 1:], values)
+    assert os.path.isfile(tmp_path / "CASE.summary" / "values.npy")
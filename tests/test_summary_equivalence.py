@@ -0,0 +1,176 @@
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pytest
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY
+
+Selection = Optional[Union[str, Sequence[str]]]
+
+columns = [
+    ("TIME", ":+:+:+:+", 0, "DAYS"),
+    ("WOPR", "W1", 0, "SM3/DAY"),
+    ("WOPR", "W1", 0, "SM3/DAY"),
+    ("WBHP", "W1", 0, "BARSA"),
+    ("SOFR", "W1", 1, "SM3/DAY"),
+    ("SOFR", "W1", 2, "SM3/DAY"),
+    ("SOFR", "W1", 2, "SM3/DAY"),
+    ("SPR", "W1", 3, "BARSA"),
+    ("WOPR", "W2", 0, "SM3/DAY"),
+    ("WBHP", "W2", 0, "BARSA"),
+    ("SOFR", "W2", 1, "SM3/DAY"),
+    ("SPR", "W2", 4, "BARSA"),
+    ("WOPR", "W3", 0, "SM3/DAY"),
+    ("WOPR", "W3", 0, "RM3/DAY"),
+    ("GOPR", "G1", 0, "SM3/DAY"),
+    ("GOPR", "G1", 0, "SM3/DAY"),
+    ("FOPR", "FIELD", 0, "SM3/DAY"),
+]
+
+
+def header_columns(summary: SUMMARY) -> List[Tuple[str, str, int, str]]:
+    header = summary.Header
+    return [
+        (str(k), str(n), int(m), str(u))
+        for k, n, m, u in zip(header.Keywords, header.Names, header.Num, header.Unit)
+    ]
+
+
+def as_list(values: Selection) -> Optional[List[str]]:
+    if values is None:
+        return None
+    if isinstance(values, str):
+        return [str(values)]
+    return [str(value) for value in values]
+
+
+def reference_index(
+    keywords: Selection = None,
+    names: Selection = None,
+    num: Selection = None,
+) -> List[int]:
+    filters = [as_list(keywords), as_list(names), as_list(num)]
+    index = []
+    for column, key in enumerate(columns):
+        values = [str(key[0]), str(key[1]), str(key[2])]
+        if all(f is None or v in f for f, v in zip(filters, values)):
+            index.append(column)
+    return index
+
+
+def reference_compact(
+    summary: SUMMARY,
+) -> Tuple[List[Tuple[str, str, int, str]], np.ndarray]:
+    values = summary.Values
+    duplicate = [columns.count(key) > 1 for key in columns]
+    kept, results = [], []
+    seen = set()
+    for column, key in enumerate(columns):
+        if not duplicate[column]:
+            kept.append(key)
+            results.append(values[:, column])
+        elif key[:3] not in seen:
+            seen.add(key[:3])
+            group = [
+                other_id
+                for other_id, other in enumerate(columns)
+                if duplicate[other_id] and other[:3] == key[:3]
+            ]
+            kept.append(key)
+            results.append(values[:, group].sum(axis=1))
+    return kept, np.stack(results, axis=1)
+
+
+def reference_columns(name: str, prefix: str) -> List[int]:
+    return [
+        column
+        for column, key in enumerate(columns)
+        if key[1] == name and key[0].startswith(prefix)
+    ]
+
+
+@pytest.mark.parametrize(
+    "keywords, names, num",
+    [
+        ("WOPR", None, None),
+        ("WOPR", "W1", None),
+        ("WOPR", "W1", "0"),
+        ("SOFR", "W1", "2"),
+        (None, "W2", None),
+        (None, None, ["1", "2"]),
+        (["WOPR", "WBHP"], ["W1", "W3"], None),
+        (["SOFR", "SPR"], None, ["1", "4"]),
+        ("NOPE", None, None),
+        ("WOPR", "NOPE", None),
+        ("WOPR", "W1", "7"),
+        ([], None, None),
+    ],
+)
+def test_index_matches_reference(
+    make_summary: Callable[..., SUMMARY],
+    keywords: Selection,
+    names: Selection,
+    num: Selection,
+) -> None:
+    summary = make_summary(columns, steps=4)
+    expected = reference_index(keywords, names, num)
+
+    assert list(summary.Header.index(keywords, names, num)) == expected
+    selected = summary.get(keywords, names, num)
+    assert np.array_equal(selected.Values, summary.Values[:, expected])
+    assert header_columns(selected) == [columns[column] for column in expected]
+
+
+def test_compact_matches_reference(make_summary: Callable[..., SUMMARY]) -> None:
+    summary = make_summary(columns, steps=4)
+    expected_columns, expected_values = reference_compact(summary)
+    compacted = summary.compact()
+
+    assert header_columns(compacted) == expected_columns
+    assert np.array_equal(compacted.Values, expected_values)
+
+
+def test_compact_without_duplicates_keeps_everything(
+    make_summary: Callable[..., SUMMARY],
+) -> None:
+    summary = make_summary(columns, steps=4).get(names="W2")
+    compacted = summary.compact()
+
+    assert header_columns(compacted) == header_columns(summary)
+    assert np.array_equal(compacted.Values, summary.Values)
+
+
+def test_split_matches_reference(make_summary: Callable[..., SUMMARY]) -> None:
+    summary = make_summary(columns, steps=4)
+    field = summary.split()
+
+    assert list(field.Wells) == ["W1", "W2", "W3"]
+    for name, well in field.Wells.items():
+        assert well.Segments is not None
+        for data, prefix in ((well.WellHead.Data, "W"), (well.Segments.Data, "S")):
+            expected = reference_columns(name, prefix)
+            assert header_columns(data) == [columns[c] for c in expected]
+            assert np.array_equal(data.Values, summary.Values[:, expected])
+
+
+def test_split_by_bore_matches_reference(make_summary: Callable[..., SUMMARY]) -> None:
+    summary = make_summary(columns, steps=4)
+    well = np.array(["W1", "W1", "W1", "W2"])
+    bore = np.array(["B1", "B2", "B2", "B3"])
+    seg = np.array([1, 2, 3, 4])
+    field = summary.split(well, bore, seg)
+
+    for name, well_summary in field.Wells.items():
+        assert well_summary.Bore is not None
+        assert [b.BoreName for b in well_summary.Bore] == ["B1", "B2", "B3"]
+        for bore_summary in well_summary.Bore:
+            segments = seg[bore == bore_summary.BoreName]
+            expected = reference_index(None, name, [str(s) for s in segments])
+            data = bore_summary.Data
+            assert header_columns(data) == [columns[c] for c in expected]
+            assert np.array_equal(data.Values, summary.Values[:, expected])
+
+
+def test_split_without_wells_is_empty(make_summary: Callable[..., SUMMARY]) -> None:
+    summary = make_summary(columns, steps=4).get(keywords=["GOPR", "FOPR"])
+    assert len(summary.split().Wells) == 0
@@ -0,0 +1,40 @@
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARYHeader
+
+columns = [
+    ("WOPR", "W1", 0, "SM3/DAY"),
+    ("WOPR", "W2", 0, "SM3/DAY"),
+    ("WBHP", "W1", 0, "BARSA"),
+]
+
+
+def test_lookups_follow_new_arrays(make_header: Callable[..., SUMMARYHeader]) -> None:
+    header = make_header(columns)
+    assert list(header.index("WOPR", "W1")) == [0]
+    assert list(header.select("WOPR:W*")) == [0, 1]
+
+    with pytest.raises(ValueError):
+        header.Names[0] = "P1"
+
+    names = header.Names.copy()
+    names[0] = "P1"
+    header.Names = names
+    assert list(header.index("WOPR", "W1")) == []
+    assert list(header.index("WOPR", "P1")) == [0]
+    assert list(header.select("WOPR:W*")) == [1]
+
+
+def test_setter_does_not_alias_caller_array(
+    make_header: Callable[..., SUMMARYHeader],
+) -> None:
+    header = make_header(columns)
+    names = np.array(["P1", "P2", "P1"])
+    header.Names = names
+    names[0] = "X"
+
+    assert list(header.Names) == ["P1", "P2", "P1"]
+    assert list(header.index("WOPR", "P1")) == [0]
@@ -0,0 +1,92 @@
+import copy
+import pickle
+
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import (
+    SUMMARY,
+    SUMMARYHeader,
+    SummaryView,
+)
+
+columns = [
+    ("TIME", ":+:+:+:+", 0, "DAYS"),
+    ("WOPR", "W1", 0, "SM3/DAY"),
+    ("WOPR", "W2", 0, "SM3/DAY"),
+    ("WBHP", "W1", 0, "BARSA"),
+]
+
+
+def test_values_view_follows_parent(make_summary: Callable[..., SUMMARY]) -> None:
+    summary = make_summary(columns)
+    view = summary.get(keywords="WOPR")
+    assert isinstance(view, SummaryView)
+
+    values = view.values_view()
+    with pytest.raises(ValueError):
+        values[:] = 0
+    summary.Values[:, 1] = -1
+    assert np.all(view.values_view()[:, 0] == -1)
+    assert not view.is_materialized
+
+
+def test_values_are_a_writable_snapshot(make_summary: Callable[..., SUMMARY]) -> None:
+    summary = make_summary(columns)
+    view = summary.get(keywords="WOPR")
+
+    view.Values[:, 0] *= 10
+    assert view.is_materialized
+    assert np.array_equal(view.Values[:, 0], [10, 50, 90])
+    assert np.array_equal(summary.Values[:, 1], [1, 5, 9])
+
+    summary.Values[:, 1] = -1
+    assert np.array_equal(view.Values[:, 0], [10, 50, 90])
+
+
+def test_view_copies_keep_type(make_summary: Callable[..., SUMMARY]) -> None:
+    view = make_summary(columns).get(names="W1")
+    for other in (
+        copy.copy(view),
+        copy.deepcopy(view),
+        pickle.loads(pickle.dumps(view)),
+    ):
+        assert type(other) is SummaryView
+        assert np.array_equal(other.Values, view.Values)
+        assert list(other.Header.Keywords) == ["WOPR", "WBHP"]
+
+
+def test_chained_selection_uses_parent_header(
+    make_summary: Callable[..., SUMMARY], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    summary = make_summary(columns)
+    built = []
+    new = SUMMARYHeader.new
+    monkeypatch.setattr(
+        SUMMARYHeader,
+        "new",
+        lambda self, index: built.append(index) or new(self, index),
+    )
+
+    view = summary.get(names="W1").get_group("wel").get(keywords="WBHP")
+    assert isinstance(view, SummaryView)
+    assert built == []
+    assert list(view.Index) == [3]
+    assert list(view.Header.Keywords) == ["WBHP"]
+    assert np.array_equal(view.Values, summary.Values[:, [3]])
+
+    assert list(summary.get(names="W1").select("WOPR:*").Index) == [1]
+    assert summary.get(names="W2").get(keywords="WBHP").shape == (3, 0)
+
+
+def test_replaced_view_header_is_used(make_summary: Callable[..., SUMMARY]) -> None:
+    view = make_summary(columns).get(keywords="WOPR")
+    header = view.Header.new(np.arange(2))
+    header.Names = np.array(["P1", "P2"])
+    view.Header = header
+
+    selected = view.get(names="P2")
+    assert list(selected.Header.Names) == ["P2"]
+    assert np.array_equal(selected.Values, view.Values[:, [1]])
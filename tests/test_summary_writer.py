@@ -0,0 +1,56 @@
+import numpy as np
+
+from pathlib import Path
+from typing import Callable
+
+from HydrodynamicUtilities.Models.EclipseBinaryFile import SUMMARY
+from HydrodynamicUtilities.Reader.EclipseBinaryParser import read_summary
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BaseBinaryReader import (
+    BinaryReader,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BinaryFile import Convertor
+from HydrodynamicUtilities.Writer.EclipseBinary import write_summary
+
+
+def test_summary_round_trip_keeps_start_seconds(
+    tmp_path: Path, make_summary: Callable[..., SUMMARY]
+) -> None:
+    start = np.datetime64("2020-01-01T10:20:30.250", "ms")
+    columns = [
+        ("TIME", ":+:+:+:+", 0, "DAYS"),
+        ("WOPR", "W1", 0, "SM3/DAY"),
+        ("WBHP", "W1", 0, "BARSA"),
+    ]
+    values = np.array([[0, 1, 2], [1, 3, 4], [2, 5, 6]], dtype=np.float32)
+    summary = make_summary(columns, values, start=str(start))
+    dates = summary.TimeVector.to_datetime64()
+
+    write_summary(tmp_path / "CASE.SMSPEC", summary, start_date=start)
+    smspec = BinaryReader.read_all_file(tmp_path / "CASE.SMSPEC")
+    startdat = Convertor.to_as_it_is(smspec)["STARTDAT"]
+    assert list(startdat) == [1, 1, 2020, 10, 20, 30 * 10**6 + 250 * 10**3]
+
+    result = read_summary(tmp_path / "CASE.SMSPEC")
+
+    assert np.array_equal(result.TimeVector.to_datetime64(), dates)
+    assert np.array_equal(result.get("WOPR", "W1").Values.ravel(), [1, 3, 5])
+    assert np.array_equal(result.get("WBHP", "W1").Values.ravel(), [2, 4, 6])
+
+
+def test_long_names_are_written_as_names(
+    tmp_path: Path, make_summary: Callable[..., SUMMARY]
+) -> None:
+    columns = [
+        ("WOPR", "PRODUCER_LONG_1", 0, "SM3/DAY"),
+        ("WOPR", "PRODUCER_LONG_2", 0, "SM3/DAY"),
+    ]
+    values = np.array([[1, 2], [3, 4]], dtype=np.float32)
+    summary = make_summary(columns, values)
+
+    write_summary(tmp_path / "CASE.SMSPEC", summary)
+    smspec = Convertor.to_as_it_is(BinaryReader.read_all_file(tmp_path / "CASE.SMSPEC"))
+    assert "WGNAMES" not in smspec
+    result = read_summary(tmp_path / "CASE.SMSPEC")
+
+    assert np.array_equal(result.get("WOPR", "PRODUCER_LONG_1").Values.ravel(), [1, 3])
+    assert np.array_equal(result.get("WOPR", "PRODUCER_LONG_2").Values.ravel(), [2, 4])
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from pathlib import Path
+
+from HydrodynamicUtilities.Reader.EclipseBinaryParser.BinaryFile import (
+    read_unrst_rsspec,
+)
+from HydrodynamicUtilities.Reader.EclipseBinaryParser import RestartFollower
+from HydrodynamicUtilities.Writer.EclipseBinary import BinaryWriter
+
+steps = {
+    0: {"IWEL": [1, 2, 3], "ZWEL": ["PROD1", "INJ1"]},
+    3: {"IWEL": [4, 5, 6, 7, 8, 9], "ZWEL": ["PROD1", "INJ1", "PROD2"]},
+    5: {"IWEL": [10], "ZWEL": ["PROD3"], "PRESSURE": [1.5, 2.5]},
+}
+
+
+def write_unrst(link: Path) -> Path:
+    with BinaryWriter(link) as writer:
+        for step, records in steps.items():
+            writer.write("SEQNUM", [step], "INTE")
+            writer.write("IWEL", records["IWEL"], "INTE")
+            writer.write("ZWEL", records["ZWEL"], "CHAR")
+            if "PRESSURE" in records:
+                writer.write("PRESSURE", records["PRESSURE"], "REAL")
+    return link
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_steps_of_varying_length(tmp_path: Path, lazy: bool) -> None:
+    unrst = read_unrst_rsspec(write_unrst(tmp_path / "CASE.UNRST"), lazy=lazy)
+
+    assert list(unrst.steps) == list(steps)
+    for step, records in steps.items():
+        for keyword, values in records.items():
+            assert list(unrst.get(keyword, step)) == values, (keyword, step)
+
+    assert [step for step, values in unrst.iter_steps("ZWEL")] == list(steps)
+    assert [step for step, values in unrst.iter_steps("PRESSURE")] == [5]
+    with pytest.raises(KeyError):
+        unrst.get("PRESSURE", 3)
+
+
+def test_follower_picks_up_new_files(tmp_path: Path) -> None:
+    follower = RestartFollower(tmp_path / "CASE.UNRST")
+    assert len(follower.refresh().UNRST.keys()) == 0
+
+    for number, (step, records) in enumerate(steps.items()):
+        with BinaryWriter(tmp_path / f"CASE.X{number:04d}") as writer:
+            writer.write("SEQNUM", [step], "INTE")
+            writer.write("IWEL", records["IWEL"], "INTE")
+        if number == 0:
+            assert list(follower.refresh().steps) == [0]
+
+    with BinaryWriter(tmp_path / "NEXT.X0003") as writer:
+        writer.write("SEQNUM", [7], "INTE")
+        writer.write("IWEL", [11, 12], "INTE")
+    written = (tmp_path / "NEXT.X0003").read_bytes()
+    seqnum_end = 24 + 3 * 4
+
+    for size in range(1, len(written)):
+        (tmp_path / "CASE.X0003").write_bytes(written[:size])
+        unrst = follower.refresh()
+        expected = [*steps, 7] if size == seqnum_end else list(steps)
+        assert list(unrst.steps) == expected, size
+    assert list(unrst.get("IWEL", 5)) == [10]
+
+    (tmp_path / "CASE.X0003").write_bytes(written)
+    assert list(follower.refresh().steps) == [*steps, 7]